@@ -90,6 +90,20 @@ class BaseAgent(ABC):
         
         # LLM interface (set by subclass)
         self.llm = None
+        
+        # Identity fields never change after construction - build their dict once
+        self._static_dict: Dict[str, Any] = {
+            "id": self.id,
+            "name": self.name,
+            "role": self.role,
+            "personality": {
+                "openness": personality.openness,
+                "conscientiousness": personality.conscientiousness,
+                "extraversion": personality.extraversion,
+                "agreeableness": personality.agreeableness,
+                "neuroticism": personality.neuroticism
+            }
+        }
     
     # ==================== PERCEPTION ====================
     
@@ -295,21 +309,12 @@ class BaseAgent(ABC):
         # Mix base identity with dynamic cognitive state
         state_dict = self.cognitive_state.to_dict()
         
-        return {
-            "id": self.id,
-            "name": self.name,
-            "role": self.role,
+        # Identity/personality come from the dict built once in __init__
+        return self._static_dict | {
             "location": self.cognitive_state.world_location,
             "activity": self.cognitive_state.act_description,
             "emoji": self.cognitive_state.act_emoji,
             "mood": "neutral",  # Could be added to cognitive state
-            "personality": {
-                "openness": self.personality.openness,
-                "conscientiousness": self.personality.conscientiousness,
-                "extraversion": self.personality.extraversion,
-                "agreeableness": self.personality.agreeableness,
-                "neuroticism": self.personality.neuroticism
-            },
             # Return full cognitive state for debug/display
             "cognitive_state": state_dict
         }
@@ -2,6 +2,9 @@
 Generative Agent with LLM integration for ISRO simulation
 Uses Ollama (local LLM) via PARL Engine
 """
+import json
+import re
+import traceback
 from typing import List, Dict, Any, Optional
 from .base import BaseAgent, Personality, Memory
 from .history_loader import HistoryLoader, create_default_agent_definitions
@@ -129,23 +132,27 @@ Be specific when moving.
             "all_agent_names": [a["name"] for a in env_state.get("agents_at_location", [])] if env_state else []
         }
         
+        # Lean agent view for the prompt: cached identity + the few fields that change per step
+        # (the full to_dict() also serializes the whole cognitive state, which PARL never reads)
+        agent_dict = self._static_dict | {
+            "location": self.cognitive_state.world_location,
+            "activity": self.cognitive_state.act_description,
+            "mood": self.cognitive_state.mood
+        }
+        
         try:
-            decision = await parl_engine.reason(self.to_dict(), context)
+            decision = await parl_engine.reason(agent_dict, context)
             if decision:
                 return decision
             else:
                 return self._default_behavior()
         except Exception as e:
             print(f"LLM error for {self.name}: {e}")
-            import traceback
             traceback.print_exc()
             return self._default_behavior()
     
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """Parse LLM response into action dict"""
-        import json
-        import re
-        
         try:
             json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
             if json_match:
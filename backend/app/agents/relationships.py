@@ -31,28 +31,66 @@ class RelationshipManager:
         
         # Default relationship strength for colleagues
         self.default_strength = 50
+        
+        # Known agents (name -> position), used to validate lazily created pairs
+        self._names: List[str] = []
+        self._idx: Dict[str, int] = {}
+        # When the roster was set up; untouched pairs report this as last_interaction
+        self._initialized_at = datetime.now()
     
     def initialize_relationships(self, agent_names: List[str]):
-        """Initialize relationships between all agents"""
-        for agent_a in agent_names:
-            self.relationships[agent_a] = {}
-            for agent_b in agent_names:
-                if agent_a != agent_b:
-                    self.relationships[agent_a][agent_b] = Relationship(
-                        agent_a=agent_a,
-                        agent_b=agent_b,
-                        strength=self.default_strength
-                    )
+        """
+        Initialize relationships between all agents.
+        
+        Only the name index is built here. Pairs that never interacted stay
+        virtual: readers get a default record built on the fly, and a record is
+        only stored once update_after_interaction writes to the pair.
+        """
+        self._names = list(agent_names)
+        self._idx = {name: i for i, name in enumerate(self._names)}
+        self._initialized_at = datetime.now()
+        self.relationships = {name: {} for name in self._names}
+    
+    def _default(self, agent_a: str, agent_b: str) -> Relationship:
+        """Unstored record for a pair that has never interacted"""
+        return Relationship(
+            agent_a=agent_a,
+            agent_b=agent_b,
+            strength=self.default_strength,
+            last_interaction=self._initialized_at
+        )
+    
+    def _is_pair(self, agent_a: str, agent_b: str) -> bool:
+        return agent_a != agent_b and agent_a in self._idx and agent_b in self._idx
+    
+    def _record_for_update(self, agent_a: str, agent_b: str) -> Optional[Relationship]:
+        """Stored A -> B record, created from the default on the first interaction"""
+        if not self._is_pair(agent_a, agent_b):
+            return None
+        row = self.relationships[agent_a]
+        rel = row.get(agent_b)
+        if rel is None:
+            rel = row[agent_b] = self._default(agent_a, agent_b)
+        return rel
     
     def get_relationship(self, agent_a: str, agent_b: str) -> Optional[Relationship]:
         """Get relationship between two agents"""
         if agent_a in self.relationships and agent_b in self.relationships[agent_a]:
             return self.relationships[agent_a][agent_b]
+        if self._is_pair(agent_a, agent_b):
+            return self._default(agent_a, agent_b)
         return None
     
     def get_all_relationships(self, agent_name: str) -> Dict[str, Relationship]:
-        """Get all relationships for an agent"""
-        return self.relationships.get(agent_name, {})
+        """Get all relationships for an agent (untouched pairs as unstored defaults)"""
+        if agent_name not in self._idx:
+            return self.relationships.get(agent_name, {})
+        stored = self.relationships[agent_name]
+        return {
+            other: stored.get(other) or self._default(agent_name, other)
+            for other in self._names
+            if other != agent_name
+        }
     
     def update_after_interaction(
         self,
@@ -63,7 +101,7 @@ class RelationshipManager:
     ):
         """Update relationship after an interaction"""
         # Update A -> B
-        rel_ab = self.get_relationship(agent_a, agent_b)
+        rel_ab = self._record_for_update(agent_a, agent_b)
         if rel_ab:
             rel_ab.interaction_count += 1
             rel_ab.last_interaction = datetime.now()
@@ -79,7 +117,7 @@ class RelationshipManager:
             rel_ab.sentiment = sentiment
         
         # Update B -> A (symmetric relationship building)
-        rel_ba = self.get_relationship(agent_b, agent_a)
+        rel_ba = self._record_for_update(agent_b, agent_a)
         if rel_ba:
             rel_ba.interaction_count += 1
             rel_ba.last_interaction = datetime.now()
@@ -14,6 +14,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
 import httpx
+import random
 import re
 
 from ..config import settings
@@ -174,7 +175,6 @@ Keep it brief (1-2 sentences). Be natural and in-character. Respond to what they
                 f"Good to see you, {listener_name}.",
                 f"Hi there! How's your shift going?"
             ]
-            import random
             response = random.choice(fallbacks)
         
         # Add turn to conversation
@@ -226,20 +226,7 @@ Summary (from a third-person perspective):"""
         if summary:
             summary = summary.strip()
             # Store as memory for both agents
-            memory_store.add_memory(
-                agent_name=agent1,
-                content=f"Conversation with {agent2}: {summary}",
-                memory_type="conversation",
-                importance=6.0,
-                related_agents=[agent2]
-            )
-            memory_store.add_memory(
-                agent_name=agent2,
-                content=f"Conversation with {agent1}: {summary}",
-                memory_type="conversation",
-                importance=6.0,
-                related_agents=[agent1]
-            )
+            memory_store.add_dialogue_pair(agent1, agent2, summary)
         
         # Clear the conversation
         del self.active_conversations[key]
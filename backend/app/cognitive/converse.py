@@ -14,6 +14,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import json
+import random
 import re
 
 
@@ -120,7 +121,6 @@ class ConversationChoreographer:
         """
         if not self.llm_client:
             # Default behavior: 50% chance if in same location
-            import random
             should_talk = random.random() > 0.5
             topic = "general check-in"
             return (should_talk, topic)
@@ -253,7 +253,6 @@ Respond in JSON format:
         """
         if not self.llm_client:
             # Use templates if no LLM
-            import random
             if is_opening:
                 template = random.choice(self.greeting_templates)
                 return template.format(target=listener_name.split()[0])
@@ -312,7 +311,6 @@ Respond with ONLY the dialogue, no quotes or speaker label."""
             return utterance
         except Exception as e:
             print(f"Error generating utterance: {e}")
-            import random
             return random.choice(self.response_templates)
     
     async def should_end_conversation(
@@ -352,7 +350,6 @@ Respond with ONLY the dialogue, no quotes or speaker label."""
         
         if not self.llm_client:
             # Without LLM, use probability based on turn count
-            import random
             end_prob = (len(context.turns) - context.minimum_turns) / context.max_turns
             if random.random() < end_prob:
                 return (True, "random_ending")
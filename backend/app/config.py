@@ -20,9 +20,13 @@ class Settings:
     OLLAMA_HOST: str = os.getenv("OLLAMA_HOST", "http://localhost:11434")
     OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
     
+    # Max concurrent LLM requests (agents reason in parallel up to this limit)
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "2"))
+    
     # Simulation
     SIMULATION_SPEED: float = float(os.getenv("SIMULATION_SPEED", "5.0"))
     NUM_AGENTS: int = int(os.getenv("NUM_AGENTS", "8"))
+    ACTIVITY_LOG_MAX: int = int(os.getenv("ACTIVITY_LOG_MAX", "50"))
     
     # Memory (FAISS)
     MEMORY_PERSIST_DIR: str = os.getenv("MEMORY_PERSIST_DIR", "./data/memories")
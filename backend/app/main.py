@@ -2,10 +2,15 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
 import asyncio
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .simulation.engine import SimulationEngine
 from .simulation.replay import get_player
 
@@ -25,25 +30,104 @@ app.add_middleware(
 )
 
 
+def _dumps(data: Any) -> str:
+    """Serialize a WebSocket payload (orjson when installed, stdlib json otherwise)"""
+    if orjson:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+def _loads(text: str) -> Any:
+    """Parse an incoming WebSocket message (orjson when installed)"""
+    if orjson:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 # WebSocket connection manager
 class ConnectionManager:
+    HEARTBEAT_INTERVAL = 15.0  # seconds between heartbeats
+    SEND_TIMEOUT = 2.0         # a client slower than this is treated as dead
+    CLIENT_TIMEOUT = 2 * HEARTBEAT_INTERVAL + SEND_TIMEOUT  # silence allowed before a client is dropped
+
     def __init__(self):
         self.active_connections: List[WebSocket] = []
+        self._last_seen: Dict[WebSocket, float] = {}
+        self._dropped: Set[WebSocket] = set()  # Closed by the server; cleared when the endpoint exits
+        self._heartbeat_task: asyncio.Task = None
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
         self.active_connections.append(websocket)
+        self.touch(websocket)
 
     def disconnect(self, websocket: WebSocket):
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        self._last_seen.pop(websocket, None)
+        self._dropped.discard(websocket)
+
+    def was_dropped(self, websocket: WebSocket) -> bool:
+        """True if the server closed this client's socket via drop()"""
+        return websocket in self._dropped
+
+    def touch(self, websocket: WebSocket):
+        """Record that a client is alive (any incoming message counts)"""
+        self._last_seen[websocket] = asyncio.get_running_loop().time()
+
+    async def drop(self, websocket: WebSocket):
+        """Forget a client and close its socket so the endpoint's receive loop ends too"""
+        self.disconnect(websocket)
+        self._dropped.add(websocket)
+        try:
+            await asyncio.wait_for(websocket.close(), self.SEND_TIMEOUT)
+        except Exception:
+            pass
+
+    async def _send_one(self, connection: WebSocket, text: str) -> bool:
+        """Send to one client; False if it failed or did not finish within SEND_TIMEOUT"""
+        send = asyncio.ensure_future(connection.send_text(text))
+        # Wait without cancelling: cancelling send_text could cut a frame in half
+        done, _ = await asyncio.wait({send}, timeout=self.SEND_TIMEOUT)
+        if send in done:
+            if send.exception() is None:
+                return True
+            print(f"Dropping WebSocket client: {type(send.exception()).__name__}: {send.exception()}")
+        else:
+            # Let the stalled send finish or fail on its own; just consume its outcome
+            send.add_done_callback(lambda t: t.cancelled() or t.exception())
+            print("Dropping WebSocket client: send timed out")
+        return False
+
+    async def _send_all(self, text: str):
+        """Send pre-encoded text to every client concurrently, dropping any that fail or stall"""
+        connections = list(self.active_connections)
+        results = await asyncio.gather(*(self._send_one(c, text) for c in connections))
+        for connection, ok in zip(connections, results):
+            if not ok:
+                await self.drop(connection)
 
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                print(f"Error sending to WebSocket: {e}")
+        # Encode once for all clients instead of once per connection
+        await self._send_all(_dumps(message))
+
+    async def _heartbeat(self):
+        """Ping clients periodically and drop those that have stopped answering"""
+        text = _dumps({"type": "heartbeat"})
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+            now = loop.time()
+            for connection in list(self.active_connections):
+                if now - self._last_seen.get(connection, now) > self.CLIENT_TIMEOUT:
+                    print("Dropping WebSocket client: no response to heartbeats")
+                    await self.drop(connection)
+            if self.active_connections:
+                await self._send_all(text)
+
+    def start_heartbeat(self):
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
 
 
 manager = ConnectionManager()
@@ -56,6 +140,11 @@ simulation = SimulationEngine(on_update=broadcast_update)
 player = get_player()
 
 
+@app.on_event("startup")
+async def start_heartbeat():
+    manager.start_heartbeat()
+
+
 @app.get("/")
 async def root():
     return {"message": "ISRO Chandrayaan-5 Simulation API", "status": "online", "version": "2.0.0"}
@@ -126,7 +215,7 @@ async def get_agent_full(agent_name: str):
     from .agents.relationships import relationship_manager
     
     # Find agent
-    agent = next((a for a in simulation.agents if a.name == agent_name), None)
+    agent = simulation.get_agent_by_name(agent_name)
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
     
@@ -194,33 +283,41 @@ async def websocket_endpoint(websocket: WebSocket):
     
     # Send initial state
     try:
-        await websocket.send_json({
+        await websocket.send_text(_dumps({
             "type": "connected",
             "message": "Connected to simulation",
             "state": simulation.get_state()
-        })
+        }))
     except Exception as e:
         print(f"Error sending initial state: {e}")
     
     try:
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
+            manager.touch(websocket)
+            message = _loads(data)
             
             # Handle incoming commands
             if message.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                await websocket.send_text(_dumps({"type": "pong"}))
             elif message.get("type") == "get_state":
-                await websocket.send_json({
+                await websocket.send_text(_dumps({
                     "type": "state_update",
                     "state": simulation.get_state()
-                })
+                }))
             elif message.get("type") == "start":
                 await simulation.start()
             elif message.get("type") == "stop":
                 await simulation.stop()
             
     except WebSocketDisconnect:
+        pass
+    except RuntimeError:
+        # Receiving on a socket the server closed (dropped as unresponsive) is expected;
+        # anything else is a real error from command handling
+        if not manager.was_dropped(websocket):
+            raise
+    finally:
         manager.disconnect(websocket)
 
 
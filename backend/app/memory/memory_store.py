@@ -272,19 +272,18 @@ class MemoryStore:
         propagation_chain: List[str] = None
     ) -> str:
         """Add a memory with semantic embedding and FAISS indexing"""
-        # Initialize if needed
-        if agent_name not in self.memories:
-            self.memories[agent_name] = []
-            if faiss:
-                self.indices[agent_name] = faiss.IndexFlatIP(self.embedding_dim)
-        
-        memory_id = f"{agent_name}_{datetime.now().timestamp()}"
+        # One clock read for the ID and both timestamp fields
+        now = datetime.now()
+        timestamp = now.timestamp()
+        memory_id = f"{agent_name}_{timestamp}"
         
         memory = Memory(
             id=memory_id,
             content=content,
             memory_type=memory_type,
             importance=importance,
+            timestamp=now,
+            timestamp_unix=timestamp,
             location=location,
             related_agents=related_agents or [],
             source=source,
@@ -294,6 +293,55 @@ class MemoryStore:
         # Generate semantic embedding
         memory.embedding = self._text_to_embedding(content)
         
+        self._append_memory(agent_name, memory)
+        
+        return memory_id
+    
+    def add_dialogue_pair(
+        self,
+        agent1: str,
+        agent2: str,
+        text: str,
+        memory_type: str = "conversation",
+        importance: float = 6.0,
+        location: str = ""
+    ) -> List[str]:
+        """
+        Store the same exchange in both participants' memories.
+        
+        The embedding is computed once on the shared text and reused for both
+        rows, instead of running the embedder twice on near-identical input.
+        """
+        embedding = self._text_to_embedding(text)
+        now = datetime.now()
+        timestamp = now.timestamp()
+        
+        memory_ids = []
+        for owner, other in ((agent1, agent2), (agent2, agent1)):
+            memory = Memory(
+                id=f"{owner}_{timestamp}",
+                content=f"Conversation with {other}: {text}",
+                memory_type=memory_type,
+                importance=importance,
+                location=location,
+                related_agents=[other],
+                timestamp=now,
+                timestamp_unix=timestamp
+            )
+            memory.embedding = embedding
+            self._append_memory(owner, memory)
+            memory_ids.append(memory.id)
+        
+        return memory_ids
+    
+    def _append_memory(self, agent_name: str, memory: Memory):
+        """Append an embedded memory to the agent's stream and FAISS index"""
+        # Initialize if needed
+        if agent_name not in self.memories:
+            self.memories[agent_name] = []
+            if faiss:
+                self.indices[agent_name] = faiss.IndexFlatIP(self.embedding_dim)
+        
         self.memories[agent_name].append(memory)
         
         # Add normalized embedding to FAISS for cosine similarity
@@ -304,8 +352,6 @@ class MemoryStore:
         # Persist every 5 memories
         if len(self.memories[agent_name]) % 5 == 0:
             self._save_agent(agent_name)
-        
-        return memory_id
     
     def retrieve_memories(
         self,
@@ -83,6 +83,83 @@ class RateLimiter:
                  self.token_timestamps.append((actual - estimated, datetime.now().timestamp()))
 
 
+# Lookup tables used on every decision (built once, not per call)
+_VALID_ACTIONS = ("move", "talk", "work", "rest")
+_VALID_ACTION_SET = frozenset(_VALID_ACTIONS)
+_WANDER_LOCATIONS = ("Mess Hall", "Rec Room", "Medical Bay", "Crew Quarters")
+_ROLE_WORKSPACE = {
+    'Commander': 'Mission Control',
+    'Botanist': 'Agri Lab',
+    'AI Assistant': 'Mission Control',
+    'Surgeon': 'Medical Bay',
+    'Engineer': 'Mining Tunnel',
+    'Geologist': 'Mining Tunnel',
+    'Communications Officer': 'Comms Tower',
+    'Crew Welfare Officer': 'Mess Hall',
+}
+
+
+class _JsonObjectScanner:
+    """
+    Incremental brace-depth scanner over streamed LLM text.
+    
+    feed() returns True once a balanced top-level {...} has closed AND decodes
+    to a decision dict (one with an "action" key), so callers can stop reading
+    the stream instead of waiting for the model to finish trailing prose.
+    Balanced braces that are not a decision (e.g. "{maybe}" in leading prose)
+    are skipped and scanning continues.
+    """
+    def __init__(self):
+        self._parts: List[str] = []
+        self._length = 0
+        self._depth = 0
+        self._start: Optional[int] = None  # offset of the open candidate's "{"
+        self._in_string = False
+        self._escaped = False
+        self.result: Optional[Dict[str, Any]] = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> bool:
+        offset = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        for i, ch in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                if self._start is not None:
+                    self._in_string = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._start = offset + i
+                self._depth += 1
+            elif ch == "}" and self._start is not None:
+                self._depth -= 1
+                if self._depth == 0:
+                    if self._accept(self.text[self._start:offset + i + 1]):
+                        return True
+                    self._start = None
+        return False
+
+    def _accept(self, candidate: str) -> bool:
+        try:
+            decoded = json.loads(candidate)
+        except ValueError:
+            return False
+        if isinstance(decoded, dict) and "action" in decoded:
+            self.result = decoded
+            return True
+        return False
+
+
 class PARLEngine:
     """
     PARL (Perception, Action, Reasoning, Learning) Engine
@@ -132,8 +209,8 @@ class PARLEngine:
                 self.rate_limiter = RateLimiter(rpm_limit=5, tpm_limit=4000)
                 print(f"   Limits: 5 RPM, 4k TPM (70b model)")
         
-        # Async Lock for FCFS Queue
-        self.lock = asyncio.Lock()
+        # Bounded concurrency for LLM calls (agents reason in parallel up to this limit)
+        self.semaphore = asyncio.Semaphore(max(1, settings.LLM_MAX_CONCURRENCY))
         
         # Action history tracking for anti-repetition
         self.action_history: Dict[str, List[Dict[str, str]]] = {}
@@ -143,8 +220,8 @@ class PARLEngine:
         """R - REASONING: Use LLM to decide agent's next action"""
         prompt = self._build_agent_prompt(agent, context)
         
-        # ACQUIRE LOCK (FCFS Queue)
-        async with self.lock:
+        # ACQUIRE SLOT (bounded concurrency)
+        async with self.semaphore:
             for attempt in range(3):
                 try:
                     # Rate limit for cloud providers
@@ -177,27 +254,39 @@ class PARLEngine:
         return self._fallback_decision(agent)
     
     async def _call_ollama(self, prompt: str) -> Optional[Dict[str, Any]]:
-        """Call local Ollama API - NO RATE LIMITS!"""
+        """Call local Ollama API - NO RATE LIMITS!
+        
+        Streams the completion and hangs up as soon as the decision JSON closes,
+        so trailing chatter after the object is never decoded.
+        """
         async with httpx.AsyncClient(timeout=120.0) as client:
             try:
-                response = await client.post(
+                async with client.stream(
+                    "POST",
                     f"{self.ollama_host}/api/generate",
                     json={
                         "model": self.ollama_model,
                         "prompt": prompt,
-                        "stream": False,
+                        "stream": True,
                         "options": {
                             "temperature": 0.7,
                             "num_predict": 150
                         }
                     }
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    text = data.get("response", "")
-                    return self._parse_response(text)
-                else:
-                    print(f"Ollama Error {response.status_code}: {response.text}")
+                ) as response:
+                    if response.status_code != 200:
+                        body = await response.aread()
+                        print(f"Ollama Error {response.status_code}: {body.decode(errors='replace')}")
+                        return None
+                    
+                    scanner = _JsonObjectScanner()
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        data = json.loads(line)
+                        if scanner.feed(data.get("response", "")) or data.get("done"):
+                            break
+                    return scanner.result or self._parse_response(scanner.text)
             except httpx.ConnectError:
                 print("❌ Cannot connect to Ollama. Is it running? Try: ollama serve")
             except Exception as e:
@@ -206,69 +295,56 @@ class PARLEngine:
 
     async def _call_groq(self, agent: Dict[str, Any], prompt: str) -> Optional[Dict[str, Any]]:
         """Call Groq API"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                self.groq_url,
-                headers={
-                    "Authorization": f"Bearer {self.groq_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.groq_model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.7,
-                    "max_tokens": 150
-                }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                text = data["choices"][0]["message"]["content"]
-                
-                # Track Usage
-                usage = data.get("usage", {})
-                total_tokens = usage.get("total_tokens", 600)
-                # Update limiter with actuals (if we implement that fine-grained logic, for now simple is ok)
-                # await self.rate_limiter.update_actual_usage(600, total_tokens) 
-                
-                return self._parse_response(text)
-            elif response.status_code == 429:
-                print(f"⚠️ Groq Rate Limit 429 Hit! Backing off...")
-                raise Exception("Rate Limit Exceeded")
-            else:
-                print(f"Groq Error {response.status_code}: {response.text}")
-        return None
+        return await self._stream_chat_completion(
+            "Groq", self.groq_url, self.groq_api_key, self.groq_model, prompt
+        )
 
     async def _call_cerebras(self, agent: Dict[str, Any], prompt: str) -> Optional[Dict[str, Any]]:
         """Call Cerebras API (OpenAI-compatible)"""
+        return await self._stream_chat_completion(
+            "Cerebras", self.cerebras_url, self.cerebras_api_key, self.cerebras_model, prompt
+        )
+
+    async def _stream_chat_completion(
+        self, provider: str, url: str, api_key: str, model: str, prompt: str
+    ) -> Optional[Dict[str, Any]]:
+        """Stream an OpenAI-compatible chat completion (SSE), stopping once the decision JSON closes"""
         async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                self.cerebras_url,
+            async with client.stream(
+                "POST",
+                url,
                 headers={
-                    "Authorization": f"Bearer {self.cerebras_api_key}",
+                    "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json"
                 },
                 json={
-                    "model": self.cerebras_model,
+                    "model": model,
                     "messages": [{"role": "user", "content": prompt}],
                     "temperature": 0.7,
-                    "max_tokens": 150
+                    "max_tokens": 150,
+                    "stream": True
                 }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                text = data["choices"][0]["message"]["content"]
+            ) as response:
+                if response.status_code == 429:
+                    print(f"⚠️ {provider} Rate Limit 429 Hit! Backing off...")
+                    raise Exception("Rate Limit Exceeded")
+                if response.status_code != 200:
+                    body = await response.aread()
+                    print(f"{provider} Error {response.status_code}: {body.decode(errors='replace')}")
+                    return None
                 
-                # Track Usage
-                usage = data.get("usage", {})
-                total_tokens = usage.get("total_tokens", 600)
-                
-                return self._parse_response(text)
-            elif response.status_code == 429:
-                print(f"⚠️ Cerebras Rate Limit 429 Hit! Backing off...")
-                raise Exception("Rate Limit Exceeded")
-            else:
-                print(f"Cerebras Error {response.status_code}: {response.text}")
-        return None
+                scanner = _JsonObjectScanner()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == "[DONE]":
+                        break
+                    choices = json.loads(payload).get("choices") or [{}]
+                    chunk = (choices[0].get("delta") or {}).get("content") or ""
+                    if scanner.feed(chunk):
+                        break
+                return scanner.result or self._parse_response(scanner.text)
 
     def _fallback_decision(self, agent: Dict[str, Any]) -> Dict[str, Any]:
         """Fallback behavior when Groq API fails (rare)"""
@@ -297,10 +373,9 @@ class PARLEngine:
             self.action_history[agent_name] = []
         
         history = self.action_history[agent_name]
-        valid_actions = ["move", "talk", "work", "rest"]
         
         # 1. Validate Action
-        if action not in valid_actions:
+        if action not in _VALID_ACTION_SET:
             if action == "check":
                 result["action"] = "work"
                 action = "work"
@@ -351,7 +426,7 @@ class PARLEngine:
         if len(history) >= 4:
             recent_actions = [h.get('action') for h in history[-4:]]
             if all(a == action for a in recent_actions):
-                alternative_actions = [a for a in valid_actions if a != action]
+                alternative_actions = [a for a in _VALID_ACTIONS if a != action]
                 new_action = random.choice(alternative_actions)
                 result["action"] = new_action
                 if "thought" in result:
@@ -362,8 +437,7 @@ class PARLEngine:
                 action = new_action
                 
                 if new_action == "move":
-                    locations = ["Mess Hall", "Rec Room", "Medical Bay", "Crew Quarters"]
-                    result["target"] = random.choice(locations)
+                    result["target"] = random.choice(_WANDER_LOCATIONS)
                 elif new_action == "work":
                     result["target"] = "station systems"
                 elif new_action == "rest":
@@ -387,9 +461,9 @@ class PARLEngine:
         )
         memories_text = "\n".join([f"- {m.get('content', '')}" for m in memories]) if memories else "None"
         
-        # Get other agents at location
-        agents_here = context.get('agents_at_location', [])
-        agents_text = ", ".join([f"{a['name']} ({a.get('role', 'crew')})" for a in agents_here if a['name'] != agent['name']]) or "None"
+        # Get other agents at location (one pass, reused for the social instruction below)
+        other_agents = [a for a in (context.get("agents_at_location") or []) if a.get('name') != agent.get('name')]
+        agents_text = ", ".join([f"{a['name']} ({a.get('role', 'crew')})" for a in other_agents]) or "None"
         
         # Check for immediate recent messages
         recent_incoming = []
@@ -408,17 +482,7 @@ class PARLEngine:
             schedule_instruction = f"📋 SCHEDULE: You're supposed to be doing '{context['scheduled_activity']}' at {context.get('scheduled_location', 'your location')}."
 
         # Role-based workspace hints to encourage movement
-        role_workspace = {
-            'Commander': 'Mission Control',
-            'Botanist': 'Agri Lab',
-            'AI Assistant': 'Mission Control',
-            'Surgeon': 'Medical Bay',
-            'Engineer': 'Mining Tunnel',
-            'Geologist': 'Mining Tunnel',
-            'Communications Officer': 'Comms Tower',
-            'Crew Welfare Officer': 'Mess Hall',
-        }
-        workspace = role_workspace.get(agent.get('role', ''), 'Mission Control')
+        workspace = _ROLE_WORKSPACE.get(agent.get('role', ''), 'Mission Control')
         current_loc = agent.get('location', 'Unknown')
         
         # Build movement instruction based on whether agent is at their workspace
@@ -428,7 +492,6 @@ class PARLEngine:
             location_instruction = f"Your workspace is {workspace}. Consider MOVING there, or explore the station."
 
         # Social awareness
-        other_agents = [a for a in (context.get("agents_at_location") or []) if a.get('name') != agent.get('name')]
         social_instruction = ""
         if 0 < len(other_agents) <= 2:
             names = ', '.join([a['name'] for a in other_agents])
@@ -101,6 +101,9 @@ class DailyPlanner:
     def __init__(self):
         self.plans: Dict[str, DailyPlan] = {}
         
+        # Retry counts per "agent:task" key (see retry_failed_task)
+        self._retry_counts: Dict[str, int] = {}
+        
         # Role-based schedule templates
         self.role_schedules = {
             "Mission Commander": [
@@ -772,9 +775,6 @@ Respond in JSON format:
         plan = self.plans[agent_name]
         
         # Track retries per task (simple in-memory tracking)
-        if not hasattr(self, '_retry_counts'):
-            self._retry_counts = {}
-        
         task_key = f"{agent_name}:{task_description}"
         current_retries = self._retry_counts.get(task_key, 0)
         
@@ -830,12 +830,14 @@ Respond in JSON format:
         conflicts = []
         available_agents = []
         
+        # De-duplicate participants (order-preserving) so no agent is booked twice
+        participating_agents = list(dict.fromkeys(participating_agents))
+        
         for agent_name in participating_agents:
             if agent_name not in self.plans:
                 continue
             
             # Check for conflicts
-            scheduled_mins = self._time_to_minutes(scheduled_time)
             current_activity = self.get_current_planned_activity(agent_name, scheduled_time)
             
             if current_activity and current_activity.priority >= 8:
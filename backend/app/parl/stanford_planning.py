@@ -9,8 +9,8 @@ Features:
 - Task decomposition into 5-15 min subtasks
 - Hierarchical planning (day -> hour -> task)
 """
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
 import asyncio
 import httpx
@@ -18,6 +18,7 @@ import json
 import re
 
 from ..config import settings
+from .parl_engine import parl_engine
 
 
 @dataclass
@@ -74,13 +75,19 @@ class StanfordPlanner:
     def __init__(self):
         self.plans: Dict[str, DailyAgentPlan] = {}
         self.llm_provider = settings.LLM_PROVIDER.lower()
+        # LLM-generated schedules keyed on (agent name, wake_hour): an agent re-planning
+        # the same wake time reuses its own day, while agents sharing a role still get
+        # their own schedules. Bounded by crew size x the few wake hours in use.
+        self._plan_templates: Dict[Tuple[str, int], List[PlannedTask]] = {}
         
     async def _call_llm(self, prompt: str) -> Optional[str]:
         """Route to appropriate LLM provider"""
-        if self.llm_provider == "ollama":
-            return await self._call_ollama(prompt)
-        else:
-            return await self._call_groq(prompt)
+        # Share the PARL engine's limit so planning and decisions draw on one LLM budget
+        async with parl_engine.semaphore:
+            if self.llm_provider == "ollama":
+                return await self._call_ollama(prompt)
+            else:
+                return await self._call_groq(prompt)
     
     async def _call_ollama(self, prompt: str) -> Optional[str]:
         """Call local Ollama - no rate limits"""
@@ -173,6 +180,14 @@ Example: 6"""
         This is the key Stanford innovation - the LLM creates the entire day's plan,
         not just responding to immediate situations.
         """
+        template_key = (agent['name'], wake_hour)
+        template = self._plan_templates.get(template_key)
+        if template:
+            # Fresh copies so each plan owns its tasks (subtasks are filled in per plan)
+            activities = [replace(task, subtasks=[]) for task in template]
+            print(f"📋 [Plan] {agent['name']} reusing {len(activities)}-activity schedule for {wake_hour}:00 wake-up")
+            return activities
+        
         prompt = f"""You are {agent['name']}, a {agent['role']} at Aryabhata Station on the Moon.
 
 You wake up at {wake_hour}:00. Create your daily schedule.
@@ -201,6 +216,8 @@ End day with sleep around 22:00-23:00."""
         
         if response:
             activities = self._parse_daily_plan(response, agent['name'])
+            if activities:
+                self._plan_templates[template_key] = [replace(task, subtasks=[]) for task in activities]
         
         # Fallback if LLM fails or returns empty
         if not activities:
@@ -371,10 +388,12 @@ Now break down: {task.activity}"""
         # 2. Generate daily activities
         activities = await self.generate_daily_plan(agent, wake_hour)
         
-        # 3. Decompose major tasks (>= 60 min)
-        for task in activities:
-            if task.duration_minutes >= 60:
-                await self.generate_task_decomp(task, agent)
+        # 3. Decompose major tasks (>= 60 min) - independent LLM calls, so run them concurrently
+        await asyncio.gather(*(
+            self.generate_task_decomp(task, agent)
+            for task in activities
+            if task.duration_minutes >= 60
+        ))
         
         # Create and store plan
         plan = DailyAgentPlan(
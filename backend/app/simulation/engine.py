@@ -8,9 +8,12 @@ Orchestrates:
 - Recording (Replay system)
 """
 import asyncio
-from typing import List, Dict, Any, Callable, Optional
+import random
+from collections import deque
+from typing import List, Dict, Any, Callable, Optional, Deque, Tuple
 from datetime import datetime, timedelta
 import traceback
+from dataclasses import dataclass
 
 from ..agents.generative_agent import GenerativeAgent, create_all_agents
 from ..agents.history_loader import HistoryLoader
@@ -26,6 +29,27 @@ from ..world.pathfinder import StationNavigator, get_navigator
 from ..simulation.replay import SimulationRecorder, get_recorder
 from ..memory.scratch import ActionStatus
 
+@dataclass(slots=True, frozen=True)
+class ActivityRecord:
+    """One entry in the activity feed (converted to a dict only when serialized)"""
+    agent: str
+    action: str
+    details: str
+    thought: str
+    location: str
+    time: str
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "agent": self.agent,
+            "action": self.action,
+            "details": self.details,
+            "thought": self.thought,
+            "location": self.location,
+            "time": self.time
+        }
+
+
 class SimulationEngine:
     """
     Main simulation engine that orchestrates all agents
@@ -38,7 +62,18 @@ class SimulationEngine:
         self.simulation_speed = settings.SIMULATION_SPEED
         self.on_update = on_update
         self.step_count = 0
-        self.activity_log: List[Dict[str, Any]] = []
+        self.activity_log: Deque[ActivityRecord] = deque(maxlen=settings.ACTIVITY_LOG_MAX)
+        self._recent_activities: Deque[ActivityRecord] = deque(maxlen=10)  # Tail served by get_state
+        self._activity_count = 0  # Total activities logged (cheap change marker)
+        self._last_broadcast_signature: Optional[Tuple] = None
+        
+        # Serialized agents cache for get_state (invalidated whenever agent state changes)
+        self._state_version = 0
+        self._agents_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+        
+        # Lookup indexes (rebuilt in initialize)
+        self._agent_by_id: Dict[str, GenerativeAgent] = {}
+        self._agent_by_name: Dict[str, GenerativeAgent] = {}
         
         # New modules
         self.choreographer = create_choreographer_with_llm()
@@ -48,10 +83,34 @@ class SimulationEngine:
         # Agent processing
         self.agents_per_step = 2  # Process 2 agents per step for rate limits
         
+        # Decision cache: identical decision contexts reuse the last LLM decision
+        self._decision_cache: Dict[Tuple, Tuple[int, Dict[str, Any]]] = {}  # key -> (expires_at_step, decision)
+        self.decision_cache_ttl = 3  # In decisions per agent (converted to steps using the round-robin)
+        self.decision_cache_max = 256
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Fast path: an agent alone at its workspace with nothing going on keeps working
+        # without an LLM call (a small share still goes to the LLM for variety)
+        self.fast_path_llm_probability = 0.1
+        self.fast_path_hits = 0
+        
+        # Action dispatch table (avoids an if/elif chain on every decision)
+        self._action_handlers: Dict[str, Callable[[GenerativeAgent, str], Any]] = {
+            "move": self._act_move,
+            "talk": self._act_talk,
+            "work": self._act_work,
+            "rest": self._act_rest,
+        }
+        
     def initialize(self):
         """Initialize all agents and place them in the world"""
         # Load agents from history/CSV
         self.agents = create_all_agents()
+        self._agent_by_id = {a.id: a for a in self.agents}
+        self._agent_by_name = {a.name: a for a in self.agents}
+        self._decision_cache = {}
+        self.invalidate_state()
         
         # Initialize relationships
         agent_names = [a.name for a in self.agents]
@@ -60,10 +119,8 @@ class SimulationEngine:
         # Place agents in their primary workspaces
         for agent in self.agents:
             location = agent.cognitive_state.primary_workspace
-            agent.cognitive_state.world_location = location
-            # Explicitly register agent in environment hierarchy
-            # Use 'None' or empty string as from_loc since they are new
-            self.environment.move_agent(agent.id, agent.name, None, location)
+            # Register agent in environment hierarchy (no previous location, they are new)
+            self.move_agent(agent, location, from_loc="")
             
             # Record initial state
             memory_store.add_memory(
@@ -112,6 +169,9 @@ class SimulationEngine:
     
     async def _simulation_loop(self):
         """Main simulation loop"""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        
         while self.is_running:
             self.step_count += 1
             self.environment.step() # Clear events
@@ -130,14 +190,28 @@ class SimulationEngine:
                 idx = (start_idx + i) % len(self.agents)
                 agents_to_process.append(self.agents[idx])
             
+            # Phase 1 (serial): advance in-progress actions, collect agents that need a decision
+            idle_agents = []
             for agent in agents_to_process:
                 if not self.is_running: break
                 
                 try:
-                    await self._process_agent(agent)
+                    if await self._advance_agent(agent):
+                        idle_agents.append(agent)
                 except Exception as e:
                     print(f"Error processing agent {agent.name}: {e}")
                     traceback.print_exc()
+            self.invalidate_state()
+            
+            # Phase 2 (concurrent): perceive + reason - LLM round-trips overlap instead of queueing
+            decisions = await asyncio.gather(
+                *(self._decide(agent) for agent in idle_agents),
+                return_exceptions=True
+            )
+            
+            # Phase 3 (serial): apply decisions, so world/location writes never interleave
+            await self._apply_decisions(idle_agents, decisions)
+            self.invalidate_state()
             
             # Record frame (full state)
             state = self.get_state()
@@ -149,32 +223,41 @@ class SimulationEngine:
                 events=state["world"].get("events", [])
             )
             
-            # Broadcast update
+            # Broadcast update.
+            # On quiet ticks (nothing visible changed) only the clock is sent;
+            # the frontend merges partial states, so agents/world stay as they were.
+            signature = self._broadcast_signature(state)
+            if signature != self._last_broadcast_signature:
+                self._last_broadcast_signature = signature
+                payload_state = state
+            else:
+                payload_state = {
+                    "time": state["time"],
+                    "step": state["step"],
+                    "is_running": state["is_running"]
+                }
             await self._broadcast_update({
                 "type": "state_update",
-                "state": state
+                "state": payload_state
             })
             
-            await asyncio.sleep(self.simulation_speed)
+            # Deadline scheduling: sleep only for what is left of this tick
+            next_tick += self.simulation_speed
+            sleep_for = next_tick - loop.time()
+            if sleep_for > 0:
+                await asyncio.sleep(sleep_for)
+            else:
+                # Step overran the interval - start the next tick now, don't burst to catch up
+                next_tick = loop.time()
     
-    async def _process_agent(self, agent: GenerativeAgent):
-        """Process a single agent step.
+    async def _advance_agent(self, agent: GenerativeAgent) -> bool:
+        """Advance a single agent's current action. Returns True if the agent is idle.
         
         Follows Stanford generative agents pattern:
         1. Check if current action/conversation is finished → end it
         2. If action still in progress → continue (let time tick)
-        3. If idle → reason for next action
+        3. If idle → caller reasons for next action (see _decide)
         """
-        env_state = self.environment.get_environment_for_agent(agent.cognitive_state.world_location)
-        
-        # Enrich agent info with roles
-        for other in env_state.get("agents_at_location", []):
-            full_agent = next((a for a in self.agents if a.name == other["name"]), None)
-            if full_agent:
-                other["role"] = full_agent.role
-            else:
-                other["role"] = "Crew"
-        
         # --- Step 1: If action is in progress, check if it's finished ---
         if agent.cognitive_state.action_status == ActionStatus.IN_PROGRESS:
             if agent.cognitive_state.is_action_finished():
@@ -186,7 +269,7 @@ class SimulationEngine:
                         "conversation", 5.0
                     )
                     # Also end the partner's conversation if they're still chatting with us
-                    partner = next((a for a in self.agents if a.name == partner_name), None)
+                    partner = self._agent_by_name.get(partner_name)
                     if partner and partner.cognitive_state.chatting_with == agent.name:
                         partner.cognitive_state.end_conversation()
                         partner.add_memory(
@@ -204,10 +287,7 @@ class SimulationEngine:
                         old_loc = agent.cognitive_state.world_location
                         final_dest = agent.cognitive_state.planned_path[-1]
                         if old_loc != final_dest:
-                            agent.cognitive_state.world_location = final_dest
-                            self.environment.move_agent(
-                                agent.id, agent.name, old_loc, final_dest
-                            )
+                            self.move_agent(agent, final_dest)
                             print(f"📍 [Arrive] {agent.name} arrived at {final_dest} (from {old_loc})")
                         agent.add_memory(f"Arrived at {final_dest}", "observation", 3.0)
                     else:
@@ -224,12 +304,106 @@ class SimulationEngine:
                 if agent.cognitive_state.path_computed:
                     await self._handle_movement_step(agent)
                 # For conversations and timed actions, just let time tick
-                return
+                return False
         
-        # --- Step 2: Agent is idle — reason for next action ---
+        return True
+    
+    async def _apply_decisions(self, agents: List[GenerativeAgent], decisions: List[Any]):
+        """Apply a batch of decisions made together, one agent at a time"""
+        for agent, decision in zip(agents, decisions):
+            if not self.is_running: break
+            
+            # An earlier decision in this batch may have pulled the agent into a
+            # conversation; its own decision predates that, so drop it (it decides
+            # again once the conversation ends)
+            if (agent.cognitive_state.action_status == ActionStatus.IN_PROGRESS
+                    or agent.cognitive_state.chatting_with):
+                continue
+            
+            try:
+                if isinstance(decision, BaseException):
+                    raise decision
+                await self._execute_decision(agent, decision)
+            except Exception as e:
+                print(f"Error processing agent {agent.name}: {e}")
+                traceback.print_exc()
+    
+    async def _decide(self, agent: GenerativeAgent) -> Dict[str, Any]:
+        """Step 2: agent is idle — perceive and reason for next action (no world writes)"""
+        # Co-located agents straight from the location index, shared by perception and reasoning
+        env_state = self.environment.get_environment_for_agent(
+            agent.cognitive_state.world_location,
+            agents_at_location=[
+                {"id": other.id, "name": other.name, "role": other.role}
+                for other in self._agents_at(agent.cognitive_state.world_location)
+                if other.id != agent.id
+            ]
+        )
         observations = agent.perceive(env_state)
+        
+        if self._is_routine(agent, env_state) and random.random() >= self.fast_path_llm_probability:
+            self.fast_path_hits += 1
+            return {
+                "thought": "Nothing new here, I'll keep at my duties.",
+                "action": "work",
+                "target": "regular duties",
+                "dialogue": None
+            }
+        
+        key = self._decision_key(agent, env_state)
+        cached = self._decision_cache.get(key)
+        if cached and cached[0] >= self.step_count:
+            self.cache_hits += 1
+            return dict(cached[1])
+        
+        self.cache_misses += 1
         decision = await agent.reason(observations, env_state)
-        await self._execute_decision(agent, decision)
+        
+        # Talk depends on the partner's state at execution time, so never replay it
+        if decision and decision.get("action") != "talk":
+            self._cache_decision(key, decision)
+        return decision
+    
+    def _is_routine(self, agent: GenerativeAgent, env_state: Dict[str, Any]) -> bool:
+        """Alone at the primary workspace, no events, and no recent conversation to respond to"""
+        if env_state["agents_at_location"] or env_state.get("events"):
+            return False
+        if agent.cognitive_state.world_location != agent.cognitive_state.primary_workspace:
+            return False
+        return not any(m.memory_type == "conversation" for m in agent.memory_stream[-5:])
+    
+    def _decision_key(self, agent: GenerativeAgent, env_state: Dict[str, Any]) -> Tuple:
+        """Everything the reasoning prompt depends on that can change between decisions"""
+        # Fingerprint of recent conversations/reflections (observations and the agent's own
+        # thoughts are excluded - they change every step without changing the situation)
+        recent = []
+        for memory in reversed(agent.memory_stream):
+            if memory.memory_type not in ("observation", "thought"):
+                recent.append(memory.content)
+                if len(recent) == 3:
+                    break
+        
+        return (
+            agent.name,
+            agent.role,
+            agent.cognitive_state.world_location,
+            agent.cognitive_state.act_description,
+            agent.cognitive_state.mood,
+            tuple(sorted(a["name"] for a in env_state["agents_at_location"])),
+            tuple(env_state.get("events") or ()),
+            hash(tuple(recent))
+        )
+    
+    def _cache_decision(self, key: Tuple, decision: Dict[str, Any]):
+        # Each agent decides at most once per round-robin cycle
+        cycle = -(-len(self.agents) // self.agents_per_step) if self.agents else 1
+        if len(self._decision_cache) >= self.decision_cache_max:
+            self._decision_cache = {
+                k: v for k, v in self._decision_cache.items() if v[0] >= self.step_count
+            }
+            if len(self._decision_cache) >= self.decision_cache_max:
+                del self._decision_cache[next(iter(self._decision_cache))]
+        self._decision_cache[key] = (self.step_count + self.decision_cache_ttl * cycle, dict(decision))
         
     async def _handle_movement_step(self, agent: GenerativeAgent):
         """Advance agent along planned path"""
@@ -237,9 +411,8 @@ class SimulationEngine:
         new_loc = agent.cognitive_state.advance_path()
         
         if new_loc:
-            success = self.environment.move_agent(
-                agent.id, agent.name, old_loc, new_loc
-            )
+            # advance_path already stepped world_location; record the move from old_loc
+            success = self.move_agent(agent, new_loc, from_loc=old_loc)
             if success:
                 agent.cognitive_state.act_description = f"moving to {agent.cognitive_state.planned_path[-1]}"
             else:
@@ -249,6 +422,30 @@ class SimulationEngine:
             agent.cognitive_state.end_action()
             agent.add_memory(f"Arrived at {agent.cognitive_state.world_location}", "observation", 3.0)
 
+    def move_agent(self, agent: GenerativeAgent, new_loc: str, from_loc: Optional[str] = None) -> bool:
+        """
+        Single entry point for changing where an agent is.
+        
+        Updates the agent's world_location and the environment's location tree
+        (the one source of truth for who is where). Returns False if the
+        environment could not resolve new_loc.
+        """
+        old_loc = agent.cognitive_state.world_location if from_loc is None else from_loc
+        agent.cognitive_state.world_location = new_loc
+        return self.environment.move_agent(agent.id, agent.name, old_loc, new_loc)
+    
+    def get_agent_by_name(self, name: str) -> Optional[GenerativeAgent]:
+        """O(1) agent lookup by display name"""
+        return self._agent_by_name.get(name)
+    
+    def _agents_at(self, location: str) -> List[GenerativeAgent]:
+        """All agents currently at a location (O(k) via the environment's occupant set)"""
+        return [
+            self._agent_by_id[aid]
+            for aid in self.environment.occupants(location)
+            if aid in self._agent_by_id
+        ]
+
     async def _execute_decision(self, agent: GenerativeAgent, decision: Dict):
         """Execute the action decided by the agent"""
         action = decision.get("action")
@@ -260,131 +457,163 @@ class SimulationEngine:
         if thought:
              # Add strictly as thought memory
             agent.add_memory(thought, "thought", 2.0)
-            
-        if action == "move":
-            # Use Navigator to plan path
-            path_result = self.navigator.find_path(agent.cognitive_state.world_location, target)
-            if path_result.path:
-                agent.cognitive_state.start_action(
-                    address=target,
-                    duration=path_result.travel_time_minutes,
-                    description=f"moving to {target}",
-                    emoji="🚶"
-                )
-                agent.cognitive_state.set_path(path_result.path)
-                print(f"🚶 [Move] {agent.name}: {agent.cognitive_state.world_location} → {target} (path: {path_result.path}, {path_result.travel_time_minutes}min)")
-                agent.add_memory(f"Started walking to {target}", "observation", 3.0)
-            else:
-                print(f"⚠️ [Move] {agent.name}: No path found from '{agent.cognitive_state.world_location}' to '{target}' — {path_result.description}")
-                agent.add_memory(f"Could not find path to {target}", "observation", 4.0)
-                
-        elif action == "talk":
-            # Attempt to start conversation
-            if agent.cognitive_state.can_talk_to(target):
-                # Find target agent object
-                target_agent = next((a for a in self.agents if a.name == target), None)
-                if target_agent:
-                    # CHECK: Is the target already in a conversation?
-                    # Stanford pattern: don't overwrite an ongoing conversation
-                    if target_agent.cognitive_state.chatting_with:
-                        agent.add_memory(
-                            f"{target} was busy talking to {target_agent.cognitive_state.chatting_with}, couldn't chat.",
-                            "observation", 3.0
-                        )
-                        # Fallback: do a short work action instead of staying idle
-                        agent.cognitive_state.start_action(
-                            address=agent.cognitive_state.world_location,
-                            duration=2, description="waiting / working briefly", emoji="⏳"
-                        )
-                        print(f"⏭️  [Conv] {agent.name} wanted to talk to {target} but they're busy → working briefly")
-                    else:
-                        # Calculate conversation end time (2 sim-minutes from now)
-                        conv_duration = 2  # minutes in sim time
-                        conv_end_time = agent.cognitive_state.current_time + timedelta(minutes=conv_duration)
-                        
-                        # Start via Choreographer (fire-and-forget, don't depend on it for lifecycle)
-                        try:
-                            await self.choreographer.start_conversation(
-                                initiator_name=agent.name,
-                                initiator_role=agent.role,
-                                initiator_personality=str(agent.personality),
-                                target_name=target_agent.name,
-                                target_role=target_agent.role,
-                                target_personality=str(target_agent.personality),
-                                topic="Check-in",
-                                location=agent.cognitive_state.world_location
-                            )
-                        except Exception as e:
-                            print(f"⚠️ Choreographer error (non-fatal): {e}")
-                        
-                        # Set states for both agents with a fixed end_time
-                        # Following Stanford pattern: conversations are timed, not turn-managed
-                        agent.cognitive_state.start_conversation(target, end_time=conv_end_time)
-                        agent.cognitive_state.act_description = f"chatting with {target}"
-                        agent.cognitive_state.action_duration = conv_duration
-                        agent.cognitive_state.action_start_time = agent.cognitive_state.current_time
-                        
-                        target_agent.cognitive_state.start_conversation(agent.name, end_time=conv_end_time)
-                        target_agent.cognitive_state.act_description = f"chatting with {agent.name}"
-                        target_agent.cognitive_state.action_duration = conv_duration
-                        target_agent.cognitive_state.action_start_time = target_agent.cognitive_state.current_time
-                        
-                        print(f"💬 [Conv] {agent.name} started conversation with {target} (ends at {conv_end_time.strftime('%H:%M')})")
-                else:
-                    agent.add_memory(f"Wanted to talk to {target} but couldn't find them.", "observation", 3.0)
+        
+        handler = self._action_handlers.get(action)
+        if handler:
+            await handler(agent, target)
+        
+        # Log activity for frontend display
+        details = f"{action} → {target}" if target else action
+        # For talk actions, add dialogue for speech bubbles
+        if action == "talk" and dialogue and agent.cognitive_state.chatting_with:
+            details = f'Said to {target}: "{dialogue}"'
+        
+        activity_entry = ActivityRecord(
+            agent=agent.name,
+            action=action or "idle",
+            details=details,
+            thought=thought or "",
+            location=agent.cognitive_state.world_location,
+            time=str(agent.cognitive_state.current_time.strftime("%H:%M")) if agent.cognitive_state.current_time else ""
+        )
+        
+        # Bounded deque drops the oldest entries automatically
+        self.activity_log.append(activity_entry)
+        self._recent_activities.append(activity_entry)
+        self._activity_count += 1
+
+    async def _act_move(self, agent: GenerativeAgent, target: str):
+        """Plan a path to the target location and start walking"""
+        # Use Navigator to plan path
+        path_result = self.navigator.find_path(agent.cognitive_state.world_location, target)
+        if path_result.path:
+            agent.cognitive_state.start_action(
+                address=target,
+                duration=path_result.travel_time_minutes,
+                description=f"moving to {target}",
+                emoji="🚶"
+            )
+            agent.cognitive_state.set_path(path_result.path)
+            print(f"🚶 [Move] {agent.name}: {agent.cognitive_state.world_location} → {target} (path: {path_result.path}, {path_result.travel_time_minutes}min)")
+            agent.add_memory(f"Started walking to {target}", "observation", 3.0)
+        else:
+            print(f"⚠️ [Move] {agent.name}: No path found from '{agent.cognitive_state.world_location}' to '{target}' — {path_result.description}")
+            agent.add_memory(f"Could not find path to {target}", "observation", 4.0)
+
+    async def _act_talk(self, agent: GenerativeAgent, target: str):
+        """Start a timed conversation with the target agent"""
+        # Attempt to start conversation
+        if agent.cognitive_state.can_talk_to(target):
+            # Find target agent object
+            target_agent = self._agent_by_name.get(target)
+            if target_agent:
+                # CHECK: Is the target already in a conversation?
+                # Stanford pattern: don't overwrite an ongoing conversation
+                if target_agent.cognitive_state.chatting_with:
+                    agent.add_memory(
+                        f"{target} was busy talking to {target_agent.cognitive_state.chatting_with}, couldn't chat.",
+                        "observation", 3.0
+                    )
+                    # Fallback: do a short work action instead of staying idle
                     agent.cognitive_state.start_action(
                         address=agent.cognitive_state.world_location,
-                        duration=2, description="looking around", emoji="👀"
+                        duration=2, description="waiting / working briefly", emoji="⏳"
                     )
+                    print(f"⏭️  [Conv] {agent.name} wanted to talk to {target} but they're busy → working briefly")
+                else:
+                    # Calculate conversation end time (2 sim-minutes from now)
+                    conv_duration = 2  # minutes in sim time
+                    conv_end_time = agent.cognitive_state.current_time + timedelta(minutes=conv_duration)
+                    
+                    # Start via Choreographer (fire-and-forget, don't depend on it for lifecycle)
+                    try:
+                        await self.choreographer.start_conversation(
+                            initiator_name=agent.name,
+                            initiator_role=agent.role,
+                            initiator_personality=str(agent.personality),
+                            target_name=target_agent.name,
+                            target_role=target_agent.role,
+                            target_personality=str(target_agent.personality),
+                            topic="Check-in",
+                            location=agent.cognitive_state.world_location
+                        )
+                    except Exception as e:
+                        print(f"⚠️ Choreographer error (non-fatal): {e}")
+                    
+                    # Set states for both agents with a fixed end_time
+                    # Following Stanford pattern: conversations are timed, not turn-managed
+                    agent.cognitive_state.start_conversation(target, end_time=conv_end_time)
+                    agent.cognitive_state.act_description = f"chatting with {target}"
+                    agent.cognitive_state.action_duration = conv_duration
+                    agent.cognitive_state.action_start_time = agent.cognitive_state.current_time
+                    
+                    target_agent.cognitive_state.start_conversation(agent.name, end_time=conv_end_time)
+                    target_agent.cognitive_state.act_description = f"chatting with {agent.name}"
+                    target_agent.cognitive_state.action_duration = conv_duration
+                    target_agent.cognitive_state.action_start_time = target_agent.cognitive_state.current_time
+                    
+                    print(f"💬 [Conv] {agent.name} started conversation with {target} (ends at {conv_end_time.strftime('%H:%M')})")
             else:
-                print(f"⏭️  [Conv] {agent.name} can't talk to {target} (cooldown or already chatting) → working briefly")
+                agent.add_memory(f"Wanted to talk to {target} but couldn't find them.", "observation", 3.0)
                 agent.cognitive_state.start_action(
                     address=agent.cognitive_state.world_location,
-                    duration=2, description="waiting / working briefly", emoji="⏳"
+                    duration=2, description="looking around", emoji="👀"
                 )
-
-        elif action == "work":
-            agent.cognitive_state.start_action(
-                address=agent.cognitive_state.world_location,
-                duration=10,
-                description=f"working on {target}",
-                emoji="💻"
-            )
-            
-        elif action == "rest":
+        else:
+            print(f"⏭️  [Conv] {agent.name} can't talk to {target} (cooldown or already chatting) → working briefly")
             agent.cognitive_state.start_action(
                 address=agent.cognitive_state.world_location,
-                duration=5,
-                description="resting",
-                emoji="😴"
+                duration=2, description="waiting / working briefly", emoji="⏳"
             )
 
-        # Log activity for frontend display
-        activity_entry = {
-            "agent": agent.name,
-            "action": action or "idle",
-            "details": f"{action} → {target}" if target else action,
-            "thought": thought or "",
-            "location": agent.cognitive_state.world_location,
-            "time": str(agent.cognitive_state.current_time.strftime("%H:%M")) if agent.cognitive_state.current_time else ""
-        }
-        # For talk actions, add dialogue for speech bubbles
-        if action == "talk" and dialogue and agent.cognitive_state.chatting_with:
-            activity_entry["details"] = f'Said to {target}: "{dialogue}"'
-        
-        self.activity_log.append(activity_entry)
-        # Keep only last 50 entries
-        if len(self.activity_log) > 50:
-            self.activity_log = self.activity_log[-50:]
+    async def _act_work(self, agent: GenerativeAgent, target: str):
+        """Work at the current location"""
+        agent.cognitive_state.start_action(
+            address=agent.cognitive_state.world_location,
+            duration=10,
+            description=f"working on {target}",
+            emoji="💻"
+        )
+
+    async def _act_rest(self, agent: GenerativeAgent, target: str):
+        """Rest at the current location"""
+        agent.cognitive_state.start_action(
+            address=agent.cognitive_state.world_location,
+            duration=5,
+            description="resting",
+            emoji="😴"
+        )
 
+    def _broadcast_signature(self, state: Dict[str, Any]) -> Tuple:
+        """Cheap fingerprint of the visible state, excluding the clock"""
+        return (
+            tuple(
+                (a["name"], a["location"], a["activity"], a["emoji"],
+                 a["cognitive_state"].get("action_status"), a["cognitive_state"].get("chatting_with"))
+                for a in state["agents"]
+            ),
+            self._activity_count,
+            tuple(state["world"].get("active_events", ())),
+            tuple(state["world"].get("blocked_connections", ()))
+        )
+    
     async def _broadcast_update(self, data: Dict):
         """Send update to frontend via callback"""
         if self.on_update:
             await self.on_update(data)
     
+    def invalidate_state(self):
+        """Mark agent state as changed so the next get_state() re-serializes agents"""
+        self._state_version += 1
+    
     def get_state(self) -> Dict[str, Any]:
         """Get current simulation state"""
-        agents_list = [agent.to_dict() for agent in self.agents]
+        # Agent serialization is the bulk of the payload and only changes when agents are
+        # processed, so reuse it across the frame record, broadcasts and REST polls
+        key = (self.step_count, self._state_version)
+        if self._agents_cache is None or self._agents_cache[0] != key:
+            self._agents_cache = (key, [agent.to_dict() for agent in self.agents])
+        agents_list = self._agents_cache[1]
         world = self.environment.to_dict()
         
         return {
@@ -393,5 +622,5 @@ class SimulationEngine:
             "is_running": self.is_running,
             "agents": agents_list,
             "world": world,
-            "recent_activities": self.activity_log[-10:]
+            "recent_activities": [record.to_dict() for record in self._recent_activities]
         }
@@ -3,11 +3,11 @@ Events System - Triggerable events for emergent behavior demonstration
 Based on Stanford's Valentine's Day party experiment
 """
 from typing import Dict, List, Optional
-from datetime import datetime
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A triggerable event that can be injected into the simulation"""
     id: str
@@ -18,11 +18,12 @@ class Event:
     trigger_time: str = ""  # When to trigger (empty = immediately)
     importance: float = 8.0  # High importance for events
     triggered: bool = False
-    triggered_at: datetime = None
+    triggered_at: int = 0  # time.monotonic_ns() at trigger (ordering only; 0 = not triggered)
 
 
-# Pre-defined demo events for emergent behavior testing
-DEMO_EVENTS = [
+# Pre-defined demo events for emergent behavior testing.
+# These are prototypes: each EventManager works on its own copies.
+DEMO_EVENTS = (
     Event(
         id="crew_meeting",
         name="Emergency Crew Meeting",
@@ -71,17 +72,22 @@ DEMO_EVENTS = [
         content="I'm planning a surprise celebration for our 100th day on the Moon tomorrow evening at 19:00 in the Rec Room. I need to secretly invite everyone without spoiling the surprise.",
         importance=7.5
     ),
-]
+)
 
 
 class EventManager:
     """Manages triggerable events for the simulation"""
     
     def __init__(self):
-        self.events: Dict[str, Event] = {e.id: e for e in DEMO_EVENTS}
+        self.events: Dict[str, Event] = self._fresh_events()
         self.active_events: List[str] = []
         self.triggered_events: List[str] = []
     
+    @staticmethod
+    def _fresh_events() -> Dict[str, Event]:
+        """Untriggered copies of the demo event prototypes"""
+        return {e.id: replace(e) for e in DEMO_EVENTS}
+    
     def get_available_events(self) -> List[Dict]:
         """Get list of events that can be triggered"""
         return [
@@ -105,7 +111,7 @@ class EventManager:
             return {"error": "Event already triggered"}
         
         event.triggered = True
-        event.triggered_at = datetime.now()
+        event.triggered_at = time.monotonic_ns()
         self.triggered_events.append(event_id)
         
         return {
@@ -117,9 +123,7 @@ class EventManager:
     
     def reset_events(self):
         """Reset all events to untriggered state"""
-        for event in self.events.values():
-            event.triggered = False
-            event.triggered_at = None
+        self.events = self._fresh_events()
         self.triggered_events = []
 
 
@@ -9,13 +9,175 @@ Key features:
 5. Export for analysis
 """
 
+import gzip
 import json
+import mmap
 import os
+import queue
+import threading
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Tuple
 from datetime import datetime
+from operator import attrgetter
+from types import GeneratorType
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Snapshot agent fields, fetched in one attrgetter call per agent
+_AGENT_KEYS = ("name", "role", "location", "activity", "energy", "mood")
+_AGENT_FIELDS = attrgetter(
+    "name", "role",
+    "cognitive_state.world_location", "cognitive_state.act_description",
+    "cognitive_state.energy", "cognitive_state.mood"
+)
+
+
+def _dumps(data: Any) -> bytes:
+    """Compact JSON bytes (orjson when installed, stdlib json otherwise)"""
+    if orjson:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, default=str, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_file(filepath: str) -> Any:
+    """Parse a JSON file; with orjson, plain files are mmapped and parsed in place"""
+    with open(filepath, 'rb') as f:
+        if orjson is None or filepath.endswith(".gz") or os.fstat(f.fileno()).st_size == 0:
+            raw = f.read()
+            if filepath.endswith(".gz"):
+                raw = gzip.decompress(raw)
+            return _loads(raw)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+
+
+def _write_atomic(filepath: str, raw: bytes):
+    """Write to a temp file and rename it into place, so readers never see a partial file"""
+    tmp_path = f"{filepath}.tmp.{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(raw)
+    os.replace(tmp_path, filepath)
+
+
+def _write_json_object(f, items: Iterable[Tuple[str, Any]]):
+    """Write (key, value) pairs as one JSON object; generator values are streamed as nested objects"""
+    f.write(b"{")
+    for i, (key, value) in enumerate(items):
+        if i:
+            f.write(b",")
+        f.write(_dumps(key) + b":")
+        if isinstance(value, GeneratorType):
+            _write_json_object(f, value)
+        else:
+            f.write(_dumps(value))
+    f.write(b"}")
+
+
+# Sections of full snapshots stored through a shared value table: relationship
+# records and plan templates repeat heavily across agents
+_DEDUP_SECTIONS = ("relationships", "plans")
+
+
+def _dedup_json(obj: Any) -> Dict[str, Any]:
+    """Replace repeated subtrees (dicts, lists, long strings) with {"_ref": i} into one value table"""
+    values: List[Any] = []
+    seen: Dict[bytes, int] = {}
+    
+    def reduce(node: Any) -> Any:
+        if isinstance(node, dict):
+            node = {k: reduce(v) for k, v in node.items()}
+        elif isinstance(node, list):
+            node = [reduce(v) for v in node]
+        elif not (isinstance(node, str) and len(node) > 16):
+            return node
+        if not node:
+            return node
+        key = _dumps(node)
+        ref = seen.get(key)
+        if ref is None:
+            ref = seen[key] = len(values)
+            values.append(node)
+        return {"_ref": ref}
+    
+    return {"values": values, "data": reduce(obj)}
+
+
+def _expand_json(packed: Dict[str, Any]) -> Any:
+    """Inverse of _dedup_json"""
+    values = packed["values"]
+    
+    def expand(node: Any) -> Any:
+        if isinstance(node, dict):
+            if len(node) == 1 and "_ref" in node:
+                return expand(values[node["_ref"]])
+            return {k: expand(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [expand(v) for v in node]
+        return node
+    
+    return expand(packed["data"])
+
+
+# Sections diffed entry-by-entry in delta snapshots (agent lists are keyed by name)
+_DELTA_SECTIONS = ("agents", "locations", "memory_counts", "relationships", "plans")
+
+
+def _keyed(section: Any) -> Dict[str, Any]:
+    if isinstance(section, list):
+        return {entry.get("name"): entry for entry in section}
+    return section or {}
+
+
+def _diff_payload(base: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Only what changed between a base snapshot payload and a newer one"""
+    changed = {}
+    sections = {}
+    for key, value in new.items():
+        if key in _DELTA_SECTIONS:
+            old_entries = _keyed(base.get(key))
+            new_entries = _keyed(value)
+            section = {
+                "set": {k: v for k, v in new_entries.items() if old_entries.get(k) != v},
+                "removed": [k for k in old_entries if k not in new_entries]
+            }
+            if isinstance(value, list):
+                section["order"] = list(new_entries)
+            sections[key] = section
+        elif base.get(key) != value:
+            changed[key] = value
+    return {"changed": changed, "sections": sections}
+
+
+def _apply_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild a full snapshot payload from its base and a delta"""
+    data = dict(base)
+    data.update(delta.get("changed", {}))
+    for key, section in delta.get("sections", {}).items():
+        entries = dict(_keyed(base.get(key)))
+        entries.update(section.get("set", {}))
+        for k in section.get("removed", []):
+            entries.pop(k, None)
+        if "order" in section:
+            data[key] = [entries[name] for name in section["order"] if name in entries]
+        else:
+            data[key] = entries
+    return data
+
 
 @dataclass
 class SimulationSnapshot:
@@ -69,24 +231,70 @@ class StateManager:
         
         # Snapshot history
         self.snapshots: List[str] = []  # List of snapshot IDs
+        # Listing metadata per snapshot ID, persisted in the index so listing never
+        # has to open the snapshot files themselves
+        self.snapshots_meta: Dict[str, Dict[str, Any]] = {}
+        
+        # Delta snapshots: every Nth snapshot is written in full (a base), the ones
+        # in between only store what changed relative to that base
+        self.full_snapshot_every = 5
+        self._base_id: Optional[str] = None
+        self._base_payload: Optional[Dict[str, Any]] = None
+        self._since_base = 0
+        
+        # Snapshots are encoded and written by a background thread so the simulation
+        # tick never waits on disk; at most two are pending, newer ones win
+        self._lock = threading.Lock()  # Guards snapshot history and the index file
+        self._write_queue: "queue.Queue[SimulationSnapshot]" = queue.Queue(maxsize=2)
         
         self._load_snapshot_index()
+        
+        self._writer = threading.Thread(target=self._writer_loop, name="snapshot-writer", daemon=True)
+        self._writer.start()
     
     def _load_snapshot_index(self):
         """Load list of existing snapshots"""
         index_path = os.path.join(self.save_dir, "snapshot_index.json")
         if os.path.exists(index_path):
             try:
-                with open(index_path, 'r') as f:
-                    self.snapshots = json.load(f)
+                with open(index_path, 'rb') as f:
+                    entries = _loads(f.read())
             except:
-                self.snapshots = []
+                entries = []
+            
+            for entry in entries:
+                if isinstance(entry, str):
+                    # Older indexes only stored IDs - read the metadata once
+                    entry = self._meta_from_file(entry)
+                    if entry is None:
+                        continue
+                self.snapshots.append(entry["id"])
+                self.snapshots_meta[entry["id"]] = entry
     
     def _save_snapshot_index(self):
-        """Save snapshot index"""
+        """Save snapshot index (metadata for each snapshot, oldest first)"""
         index_path = os.path.join(self.save_dir, "snapshot_index.json")
-        with open(index_path, 'w') as f:
-            json.dump(self.snapshots, f)
+        _write_atomic(index_path, _dumps([self.snapshots_meta[sid] for sid in self.snapshots]))
+    
+    @staticmethod
+    def _snapshot_meta(data: Dict[str, Any], base_id: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "id": data.get("snapshot_id"),
+            "timestamp": data.get("timestamp"),
+            "description": data.get("description"),
+            "step_count": data.get("step_count"),
+            "sim_time": data.get("sim_time", {}).get("hour", 0),
+            "base_id": base_id
+        }
+    
+    def _meta_from_file(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
+        data = self.load_snapshot(snapshot_id)
+        if not data:
+            return None
+        data["snapshot_id"] = snapshot_id
+        meta = self._snapshot_meta(data)
+        meta["base_id"] = self._delta_base(snapshot_id)
+        return meta
     
     def create_snapshot(
         self,
@@ -106,31 +314,19 @@ class StateManager:
         snapshot_id = f"snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Gather agent states
-        agent_states = []
-        for agent in simulation.agents:
-            agent_states.append({
-                "name": agent.name,
-                "role": agent.role,
-                "location": agent.state.location,
-                "activity": agent.state.activity,
-                "energy": agent.state.energy,
-                "mood": agent.state.mood,
-                "personality": {
-                    "openness": agent.personality.openness,
-                    "conscientiousness": agent.personality.conscientiousness,
-                    "extraversion": agent.personality.extraversion,
-                    "agreeableness": agent.personality.agreeableness,
-                    "neuroticism": agent.personality.neuroticism
-                }
-            })
+        agent_states = [
+            dict(zip(_AGENT_KEYS, _AGENT_FIELDS(agent)), personality=asdict(agent.personality))
+            for agent in simulation.agents
+        ]
         
         # Gather time state
         env = simulation.environment
+        week, day, hour, minute = env.state._get_current_sim_time()
         sim_time = {
-            "week": env.state.week,
-            "day": env.state.day,
-            "hour": env.state.hour,
-            "minute": env.state.minute,
+            "week": week,
+            "day": day,
+            "hour": hour,
+            "minute": minute,
             "accumulated_sim_minutes": env.state.accumulated_sim_minutes,
             "time_multiplier": env.state.time_multiplier
         }
@@ -162,7 +358,7 @@ class StateManager:
             sim_time=sim_time,
             agents=agent_states,
             locations=env.to_dict().get("locations", {}),
-            active_events=env.state.active_events,
+            active_events=list(env.state.active_events),
             memory_counts=memory_counts,
             relationships=relationships,
             plans=plans,
@@ -170,25 +366,85 @@ class StateManager:
             is_running=simulation.is_running
         )
         
-        # Save to file
-        self._save_snapshot(snapshot)
-        
-        # Update index
-        self.snapshots.append(snapshot_id)
-        if len(self.snapshots) > self.max_snapshots:
-            # Remove oldest
-            old_id = self.snapshots.pop(0)
-            self._delete_snapshot(old_id)
-        
-        self._save_snapshot_index()
+        # Hand off to the writer thread
+        try:
+            self._write_queue.put_nowait(snapshot)
+        except queue.Full:
+            try:
+                dropped = self._write_queue.get_nowait()
+                self._write_queue.task_done()
+                print(f"[StateManager] Writer behind, dropped snapshot: {dropped.snapshot_id}")
+            except queue.Empty:
+                pass
+            self._write_queue.put_nowait(snapshot)
         
-        print(f"[StateManager] Snapshot created: {snapshot_id}")
         return snapshot_id
     
-    def _save_snapshot(self, snapshot: SimulationSnapshot):
-        """Save snapshot to file"""
-        filepath = os.path.join(self.save_dir, f"{snapshot.snapshot_id}.json")
+    def _writer_loop(self):
+        while True:
+            snapshot = self._write_queue.get()
+            try:
+                self._write_snapshot(snapshot)
+            except Exception as e:
+                print(f"[StateManager] Error writing snapshot: {e}")
+            finally:
+                self._write_queue.task_done()
+    
+    def _write_snapshot(self, snapshot: SimulationSnapshot):
+        """Save a snapshot and update the index (runs on the writer thread)"""
+        snapshot_id = snapshot.snapshot_id
+        with self._lock:
+            # Save to file
+            data = self._save_snapshot(snapshot)
+            
+            # Update index
+            self.snapshots.append(snapshot_id)
+            self.snapshots_meta[snapshot_id] = self._snapshot_meta(
+                data, None if snapshot_id == self._base_id else self._base_id
+            )
+            if len(self.snapshots) > self.max_snapshots:
+                # Remove oldest
+                old_id = self.snapshots.pop(0)
+                self._evict_snapshot(old_id)
+                self.snapshots_meta.pop(old_id, None)
+            
+            self._save_snapshot_index()
         
+        print(f"[StateManager] Snapshot created: {snapshot_id}")
+    
+    def flush(self):
+        """Block until every queued snapshot has been written"""
+        self._write_queue.join()
+    
+    def _snapshot_path(self, snapshot_id: str) -> str:
+        return os.path.join(self.save_dir, f"{snapshot_id}.json.gz")
+    
+    def _legacy_path(self, snapshot_id: str) -> str:
+        """Uncompressed full snapshot, as written by older versions"""
+        return os.path.join(self.save_dir, f"{snapshot_id}.json")
+    
+    def _delta_path(self, snapshot_id: str) -> str:
+        return os.path.join(self.save_dir, f"{snapshot_id}.delta.json")
+    
+    def _full_path(self, snapshot_id: str) -> Optional[str]:
+        """Existing full snapshot file for an ID (compressed preferred)"""
+        for filepath in (self._snapshot_path(snapshot_id), self._legacy_path(snapshot_id)):
+            if os.path.exists(filepath):
+                return filepath
+        return None
+    
+    def _read(self, filepath: str) -> Any:
+        return _load_file(filepath)
+    
+    def _read_full(self, filepath: str) -> Dict[str, Any]:
+        """Read a full snapshot, expanding value-table sections"""
+        data = self._read(filepath)
+        for key in data.pop("deduped", []):
+            data[key] = _expand_json(data[key])
+        return data
+    
+    def _save_snapshot(self, snapshot: SimulationSnapshot) -> Dict[str, Any]:
+        """Save snapshot to file (full base, or a delta against the current base)"""
         data = {
             "snapshot_id": snapshot.snapshot_id,
             "timestamp": snapshot.timestamp.isoformat(),
@@ -204,27 +460,79 @@ class StateManager:
             "is_running": snapshot.is_running
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        if self._base_payload is None or self._since_base + 1 >= self.full_snapshot_every:
+            # Full snapshots repeat the same keys for every agent/location/relationship,
+            # so they are gzipped; deltas are small and stay plain JSON
+            filepath = self._snapshot_path(snapshot.snapshot_id)
+            payload = dict(data)
+            for key in _DEDUP_SECTIONS:
+                payload[key] = _dedup_json(data[key])
+            payload["deduped"] = list(_DEDUP_SECTIONS)
+            raw = gzip.compress(_dumps(payload), compresslevel=3, mtime=0)
+            self._base_id = snapshot.snapshot_id
+            self._base_payload = data
+            self._since_base = 0
+        else:
+            filepath = self._delta_path(snapshot.snapshot_id)
+            payload = _diff_payload(self._base_payload, data)
+            payload["base_id"] = self._base_id
+            raw = _dumps(payload)
+            self._since_base += 1
+        
+        _write_atomic(filepath, raw)
+        return data
     
     def _delete_snapshot(self, snapshot_id: str):
         """Delete a snapshot file"""
-        filepath = os.path.join(self.save_dir, f"{snapshot_id}.json")
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        for filepath in (self._snapshot_path(snapshot_id), self._legacy_path(snapshot_id), self._delta_path(snapshot_id)):
+            if os.path.exists(filepath):
+                os.remove(filepath)
+    
+    def _delta_base(self, snapshot_id: str) -> Optional[str]:
+        """Base snapshot ID of a delta snapshot (None for full snapshots)"""
+        meta = self.snapshots_meta.get(snapshot_id)
+        if meta is not None:
+            return meta.get("base_id")
+        delta_path = self._delta_path(snapshot_id)
+        if not os.path.exists(delta_path):
+            return None
+        try:
+            return self._read(delta_path).get("base_id")
+        except Exception:
+            return None
+    
+    def _has_dependents(self, base_id: str) -> bool:
+        return any(self._delta_base(sid) == base_id for sid in self.snapshots)
+    
+    def _evict_snapshot(self, snapshot_id: str):
+        """Drop a snapshot from disk, keeping base files that listed deltas still need"""
+        base_id = self._delta_base(snapshot_id)
+        if base_id is None:
+            if snapshot_id != self._base_id and not self._has_dependents(snapshot_id):
+                self._delete_snapshot(snapshot_id)
+            return
+        
+        self._delete_snapshot(snapshot_id)
+        # Last dependent of an already-evicted base: the base file can go too
+        if base_id not in self.snapshots and base_id != self._base_id and not self._has_dependents(base_id):
+            self._delete_snapshot(base_id)
     
     def load_snapshot(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
-        """Load a snapshot from file"""
-        filepath = os.path.join(self.save_dir, f"{snapshot_id}.json")
+        """Load a snapshot from file (deltas are applied to their base)"""
+        self.flush()
+        filepath = self._full_path(snapshot_id)
+        delta_path = self._delta_path(snapshot_id)
         
-        if not os.path.exists(filepath):
+        if filepath is None and not os.path.exists(delta_path):
             print(f"[StateManager] Snapshot not found: {snapshot_id}")
             return None
         
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            return data
+            if filepath is not None:
+                return self._read_full(filepath)
+            delta = self._read(delta_path)
+            base = self._read_full(self._full_path(delta["base_id"]))
+            return _apply_delta(base, delta)
         except Exception as e:
             print(f"[StateManager] Error loading snapshot: {e}")
             return None
@@ -252,16 +560,19 @@ class StateManager:
             sim_time = data.get("sim_time", {})
             simulation.environment.state.accumulated_sim_minutes = sim_time.get("accumulated_sim_minutes", 0)
             simulation.environment.state.time_multiplier = sim_time.get("time_multiplier", 1.0)
+            simulation.environment.state.clear_paused_time()
             
-            # Restore agent states
+            # Restore agent states (name lookup goes through the engine's index)
             for agent_data in data.get("agents", []):
-                for agent in simulation.agents:
-                    if agent.name == agent_data.get("name"):
-                        agent.state.location = agent_data.get("location", "Crew Quarters")
-                        agent.state.activity = agent_data.get("activity", "idle")
-                        agent.state.energy = agent_data.get("energy", 100)
-                        agent.state.mood = agent_data.get("mood", "neutral")
-                        break
+                agent = simulation.get_agent_by_name(agent_data.get("name"))
+                if agent is None:
+                    continue
+                # Moves go through the engine so its index and the environment tree stay in sync
+                simulation.move_agent(agent, agent_data.get("location", "Crew Quarters"))
+                agent.cognitive_state.act_description = agent_data.get("activity", "idle")
+                agent.cognitive_state.energy = agent_data.get("energy", 100)
+                agent.cognitive_state.mood = agent_data.get("mood", "neutral")
+            simulation.invalidate_state()
             
             # Restore step count
             simulation.step_count = data.get("step_count", 0)
@@ -274,58 +585,42 @@ class StateManager:
             return False
     
     def list_snapshots(self) -> List[Dict[str, Any]]:
-        """List all available snapshots"""
-        snapshots = []
-        
-        for snapshot_id in self.snapshots:
-            filepath = os.path.join(self.save_dir, f"{snapshot_id}.json")
-            if os.path.exists(filepath):
-                try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                    snapshots.append({
-                        "id": snapshot_id,
-                        "timestamp": data.get("timestamp"),
-                        "description": data.get("description"),
-                        "step_count": data.get("step_count"),
-                        "sim_time": data.get("sim_time", {}).get("hour", 0)
-                    })
-                except:
-                    pass
-        
-        return snapshots
+        """List all available snapshots (served from the index, no file reads)"""
+        self.flush()
+        with self._lock:
+            return [dict(self.snapshots_meta[sid]) for sid in self.snapshots]
     
     def export_for_analysis(self, simulation, filepath: str):
         """Export complete simulation data for analysis"""
         from ..memory import memory_store
         from ..agents.relationships import relationship_manager
         
-        data = {
-            "export_time": datetime.now().isoformat(),
-            "simulation_step": simulation.step_count,
-            "agents": [],
-            "all_memories": {},
-            "relationships": {},
-            "activity_log": simulation.activity_log[-100:]
-        }
-        
-        for agent in simulation.agents:
-            data["agents"].append({
-                "name": agent.name,
-                "role": agent.role,
-                "personality": {
-                    "openness": agent.personality.openness,
-                    "conscientiousness": agent.personality.conscientiousness,
-                    "extraversion": agent.personality.extraversion,
-                    "agreeableness": agent.personality.agreeableness,
-                    "neuroticism": agent.personality.neuroticism
+        # Per-agent sections are generators so each agent's memories are fetched, encoded and
+        # written one at a time instead of holding the whole export in memory
+        sections = (
+            ("export_time", datetime.now().isoformat()),
+            ("simulation_step", simulation.step_count),
+            ("agents", [
+                {
+                    "name": agent.name,
+                    "role": agent.role,
+                    "personality": asdict(agent.personality)
                 }
-            })
-            data["all_memories"][agent.name] = memory_store.get_recent_memories(agent.name, limit=50)
-            data["relationships"][agent.name] = relationship_manager.to_dict(agent.name)
+                for agent in simulation.agents
+            ]),
+            ("all_memories", (
+                (agent.name, memory_store.get_recent_memories(agent.name, limit=50))
+                for agent in simulation.agents
+            )),
+            ("relationships", (
+                (agent.name, relationship_manager.to_dict(agent.name))
+                for agent in simulation.agents
+            )),
+            ("activity_log", [record.to_dict() for record in simulation.activity_log])
+        )
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, 'wb') as f:
+            _write_json_object(f, sections)
         
         print(f"[StateManager] Exported to: {filepath}")
 
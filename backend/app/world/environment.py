@@ -9,9 +9,9 @@ Uses ACCELERATED simulation time:
 - Time ONLY advances when simulation is running
 """
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timedelta
 import time
 
 from .pathfinder import get_navigator, StationNavigator
@@ -35,31 +35,59 @@ class LocationNode:
     type: str  # "building" or "room"
     parent: Optional['LocationNode'] = None
     children: Dict[str, 'LocationNode'] = field(default_factory=dict)
-    agents: List[str] = field(default_factory=list)  # List of agent IDs
+    agents: Set[str] = field(default_factory=set)  # Agent IDs (set: O(1) add/remove on moves)
+    # Serialized subtree, rebuilt only after this node or a descendant changes
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+    _dirty: bool = field(default=True, repr=False, compare=False)
     
     def add_child(self, child_name: str, child_type: str = "room") -> 'LocationNode':
         child = LocationNode(name=child_name, type=child_type, parent=self)
         self.children[child_name] = child
+        self.mark_dirty()
         return child
     
+    def mark_dirty(self):
+        """Invalidate the cached dict of this node and every ancestor"""
+        node = self
+        while node is not None and not node._dirty:
+            node._dirty = True
+            node = node.parent
+    
     def get_full_path(self) -> str:
         if self.parent:
             return f"{self.parent.get_full_path()}/{self.name}"
         return self.name
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "name": self.name,
-            "type": self.type,
-            "agents": self.agents,
-            "children": {k: v.to_dict() for k, v in self.children.items()}
-        }
+        if not self._dirty:
+            return self._dict_cache
+        
+        # Post-order over dirty nodes only; clean subtrees reuse their cache
+        stack = [(self, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children.values() if child._dirty)
+                continue
+            node._dict_cache = {
+                "name": node.name,
+                "type": node.type,
+                "agents": sorted(node.agents),
+                "children": {k: v._dict_cache for k, v in node.children.items()}
+            }
+            node._dirty = False
+        return self._dict_cache
+
+# Real nanoseconds per simulated minute at 1x speed (1 real second = 1 sim minute)
+_NS_PER_SIM_MINUTE = 1_000_000_000
+
 
 @dataclass
 class WorldState:
     """Accelerated simulation time"""
     accumulated_sim_minutes: int = 0
-    last_update_time: float = field(default_factory=time.time)
+    last_update_ns: int = field(default_factory=time.monotonic_ns)
     is_running: bool = False
     start_sim_hour: int = 6
     start_sim_minute: int = 0
@@ -68,26 +96,48 @@ class WorldState:
     time_multiplier: float = 1.0
     active_events: List[str] = field(default_factory=list)
     agent_locations: Dict[str, str] = field(default_factory=dict) # agent_id -> full_path
+    # (week, day, hour, minute) for the minute count it was computed at
+    _cache_minutes: int = field(default=-1, repr=False)
+    _cache_tuple: tuple = field(default=(0, 0, 0, 0), repr=False)
+    # ((week, day, hour, minute), time_string) frozen by stop(); the clock can't move
+    # while paused, so polling a paused sim skips the clock read entirely
+    _paused_cache: Optional[tuple] = field(default=None, repr=False)
     
     def update_time(self):
+        now_ns = time.monotonic_ns()
         if self.is_running:
-            now = time.time()
-            delta = now - self.last_update_time
-            self.accumulated_sim_minutes += int(delta * self.time_multiplier)
-            self.last_update_time = now
+            # Only whole sim minutes are applied; the leftover fraction stays banked
+            # in last_update_ns instead of being truncated away on every call
+            minutes = int((now_ns - self.last_update_ns) * self.time_multiplier) // _NS_PER_SIM_MINUTE
+            if minutes:
+                self.accumulated_sim_minutes += minutes
+                self.last_update_ns += int(minutes * _NS_PER_SIM_MINUTE / self.time_multiplier)
         else:
-            self.last_update_time = time.time()
+            self.last_update_ns = now_ns
     
     def start(self):
         self.is_running = True
-        self.last_update_time = time.time()
+        self._paused_cache = None
+        self.last_update_ns = time.monotonic_ns()
     
     def stop(self):
         self.update_time()
         self.is_running = False
+        self._paused_cache = None
+        sim_time = self._get_current_sim_time()
+        self._paused_cache = (sim_time, self.format_time(*sim_time))
+    
+    def clear_paused_time(self):
+        """Drop the frozen paused clock (call after changing time state directly)"""
+        self._paused_cache = None
     
     def _get_current_sim_time(self) -> tuple:
+        if self._paused_cache is not None and not self.is_running:
+            return self._paused_cache[0]
         self.update_time()
+        # The clock only moves in whole minutes; reuse the last breakdown until it does
+        if self.accumulated_sim_minutes == self._cache_minutes:
+            return self._cache_tuple
         start_total = self.start_sim_hour * 60 + self.start_sim_minute
         current_total = start_total + self.accumulated_sim_minutes
         days_elapsed = current_total // (24 * 60)
@@ -97,12 +147,13 @@ class WorldState:
         total_days = self.start_sim_day + days_elapsed - 1
         week = self.start_sim_week + (total_days // 7)
         day = (total_days % 7) + 1
-        return week, day, hour, minute
+        self._cache_minutes = self.accumulated_sim_minutes
+        self._cache_tuple = (week, day, hour, minute)
+        return self._cache_tuple
     
     def get_current_datetime(self) -> datetime:
         """Single canonical source of simulation datetime.
         Used by sim loop, perceive(), and get_environment_for_agent()."""
-        from datetime import timedelta
         self.update_time()
         base_date = datetime(2030, 1, 1, self.start_sim_hour, self.start_sim_minute)
         return base_date + timedelta(minutes=self.accumulated_sim_minutes)
@@ -117,10 +168,17 @@ class WorldState:
     def minute(self) -> int: return self._get_current_sim_time()[3]
     @property
     def time_string(self) -> str:
-        w, d, h, m = self._get_current_sim_time()
-        return f"Week {w}, Day {d}, {h:02d}:{m:02d}"
+        if self._paused_cache is not None and not self.is_running:
+            return self._paused_cache[1]
+        return self.format_time(*self._get_current_sim_time())
     @property
-    def is_night(self) -> bool: return self.hour < 6 or self.hour >= 22
+    def is_night(self) -> bool: return self.is_night_hour(self.hour)
+    
+    @staticmethod
+    def format_time(week: int, day: int, hour: int, minute: int) -> str:
+        return f"Week {week}, Day {day}, {hour:02d}:{minute:02d}"
+    @staticmethod
+    def is_night_hour(hour: int) -> bool: return hour < 6 or hour >= 22
 
 class Environment:
     """Manages hierarchical simulation environment"""
@@ -128,6 +186,9 @@ class Environment:
     def __init__(self):
         self.state = WorldState()
         self.root = LocationNode(name="Aryabhata Station", type="station")
+        # Flat lookup: full path (with and without the station prefix) and lower-cased
+        # path/name -> node, so path resolution is a dict hit instead of a tree walk
+        self._node_index: Dict[str, LocationNode] = {}
         self._build_hierarchy()
         self.navigator: StationNavigator = get_navigator()
     
@@ -141,27 +202,31 @@ class Environment:
         self.root.add_child(Location.COMMS_TOWER.value, "building")
         self.root.add_child(Location.MINING_TUNNEL.value, "building")
         self.root.add_child(Location.REC_ROOM.value, "building")
-
+        self._index_nodes()
+    
+    def _index_nodes(self):
+        """(Re)build the path index from the location tree"""
+        self._node_index.clear()
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            self._register_node(node)
+            stack.extend(node.children.values())
+    
+    def _register_node(self, node: LocationNode):
+        full_path = node.get_full_path()
+        # Paths are accepted with or without the "Aryabhata Station/" prefix
+        short_path = full_path.split("/", 1)[1] if node.parent else full_path
+        for key in (full_path, short_path):
+            self._node_index[key] = node
+            self._node_index.setdefault(key.lower(), node)
+        self._node_index.setdefault(node.name.lower(), node)
     
     def _find_node(self, full_path: str) -> Optional[LocationNode]:
-        """Find a node by its full path (e.g. 'Mission Control/Command Deck')"""
+        """Find a node by its full path (e.g. 'Mission Control/Command Deck') or name"""
         if not full_path:
             return None
-            
-        parts = full_path.split("/")
-        current = self.root
-        
-        # Handle cases where path includes "Aryabhata Station" or not
-        if parts[0] == "Aryabhata Station":
-            parts = parts[1:]
-            
-        for part in parts:
-            if part in current.children:
-                current = current.children[part]
-            else:
-                # Fallback: check if 'part' matches a building name directly
-                return None
-        return current
+        return self._node_index.get(full_path) or self._node_index.get(full_path.lower().strip())
 
     def start(self): self.state.start()
     def stop(self): self.state.stop()
@@ -173,16 +238,12 @@ class Environment:
         """
         node = self._find_node(location)
         if not node:
-            # Fallback for just building name lookup at root level
-            if location in self.root.children:
-                node = self.root.children[location]
-            else:
-                return []
+            return []
         
         agents = []
         # Collect agents recursively
         def collect_agents(n: LocationNode):
-            for agent_id in n.agents:
+            for agent_id in sorted(n.agents):
                 agents.append({"id": agent_id, "name": agent_id.split("_")[0]})
             for child in n.children.values():
                 collect_agents(child)
@@ -190,73 +251,94 @@ class Environment:
         collect_agents(node)
         return agents
     
+    def _resolve_node(self, location: str) -> Optional[LocationNode]:
+        """Node for a path or name; falls back to a partial building-name match"""
+        node = self._find_node(location)
+        if node or not location:
+            return node
+        location_lower = location.lower().strip()
+        for building_name, building_node in self.root.children.items():
+            if location_lower in building_name.lower() or building_name.lower() in location_lower:
+                return building_node
+        return None
+    
+    def occupants(self, location: str) -> Set[str]:
+        """IDs of agents directly at a location (sub-areas not included)"""
+        node = self._resolve_node(location)
+        return node.agents if node else set()
+    
     def move_agent(self, agent_id: str, agent_name: str, from_loc: str, to_loc: str) -> bool:
         """
         Move agent between locations.
         Supports full paths: "Mission Control/Command Deck"
         """
-        # Remove from old
-        if from_loc:
-            old_node = self._find_node(from_loc)
-            if old_node and agent_id in old_node.agents:
-                old_node.agents.remove(agent_id)
-        
-        # Find new node
-        new_node = self._find_node(to_loc)
+        # Remove from old (the node we actually placed them in, if known)
+        old_node = self._find_node(self.state.agent_locations.get(agent_id, ""))
+        if old_node is None and from_loc:
+            old_node = self._resolve_node(from_loc)
+        if old_node and agent_id in old_node.agents:
+            old_node.agents.discard(agent_id)
+            old_node.mark_dirty()
         
-        # If not found, try robust search
-        if not new_node:
-            # Try case-insensitive match for building name
-            to_loc_lower = to_loc.lower().strip()
-            for building_name, building_node in self.root.children.items():
-                if building_name.lower() == to_loc_lower:
-                    new_node = building_node
-                    break
-            
-            # Still not found? Try partial match
-            if not new_node:
-                for building_name, building_node in self.root.children.items():
-                    if to_loc_lower in building_name.lower() or building_name.lower() in to_loc_lower:
-                        new_node = building_node
-                        break
+        # Find new node (exact/case-insensitive path, else partial building match)
+        new_node = self._resolve_node(to_loc)
         
         if new_node:
-            new_node.agents.append(agent_id)
+            new_node.agents.add(agent_id)
+            new_node.mark_dirty()
             self.state.agent_locations[agent_id] = new_node.get_full_path()
             return True
         else:
+            self.state.agent_locations.pop(agent_id, None)
             print(f"⚠️ Could not find location node: {to_loc}")
             return False
 
-    def get_environment_for_agent(self, agent_location: str) -> Dict[str, Any]:
-        """Get the current environment state for a specific agent"""
+    def get_environment_for_agent(
+        self,
+        agent_location: str,
+        agents_at_location: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Get the current environment state for a specific agent.
+        
+        Callers that already know who is co-located (the engine keeps a location
+        index) can pass agents_at_location to skip the location-tree walk.
+        """
         # Use the single canonical datetime source
         current_dt = self.state.get_current_datetime()
+        # Derive every clock field from one time computation
+        week, day, hour, minute = self.state._get_current_sim_time()
         
         return {
             "time": current_dt, # Return datetime object
-            "time_string": self.state.time_string, # Keep string for display if needed
-            "hour": self.state.hour,
-            "is_night": self.state.is_night,
-            "agents_at_location": self.get_agents_at_location(agent_location),
+            "time_string": WorldState.format_time(week, day, hour, minute), # Keep string for display if needed
+            "hour": hour,
+            "is_night": WorldState.is_night_hour(hour),
+            "agents_at_location": (
+                agents_at_location if agents_at_location is not None
+                else self.get_agents_at_location(agent_location)
+            ),
             "valid_moves": self.navigator.get_adjacent_locations(agent_location),
             "events": self.state.active_events,
             "location": agent_location
         }
     
     def step(self): self.state.active_events = [] # Clear events
-    def set_time_speed(self, multiplier: float): self.state.time_multiplier = max(0.1, min(60.0, multiplier))
+    def set_time_speed(self, multiplier: float):
+        self.state.update_time()  # Settle elapsed time at the old speed first
+        self.state.time_multiplier = max(0.1, min(60.0, multiplier))
+        self.state.clear_paused_time()
     
     def to_dict(self) -> Dict[str, Any]:
         """Return full state including hierarchical locations and blocked paths"""
+        week, day, hour, minute = self.state._get_current_sim_time()
         return {
-            "time": self.state.time_string,
-            "week": self.state.week,
-            "day": self.state.day,
-            "hour": self.state.hour,
-            "minute": self.state.minute,
+            "time": WorldState.format_time(week, day, hour, minute),
+            "week": week,
+            "day": day,
+            "hour": hour,
+            "minute": minute,
             "is_running": self.state.is_running,
-            "is_night": self.state.is_night,
+            "is_night": WorldState.is_night_hour(hour),
             "locations": self.root.to_dict()["children"], # Send children of root (Buildings)
             "active_events": self.state.active_events,
             "blocked_connections": list(self.navigator.blocked_paths) if self.navigator else []
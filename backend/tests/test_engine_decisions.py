@@ -0,0 +1,80 @@
+"""
+Tests for applying a batch of concurrently-made agent decisions.
+
+Run with pytest, or directly: python tests/test_engine_decisions.py
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Importing the engine module builds the global PARLEngine; local mode needs no API key
+os.environ.setdefault("LLM_PROVIDER", "ollama")
+
+from app.agents.base import Personality
+from app.agents.generative_agent import GenerativeAgent
+from app.simulation.engine import SimulationEngine
+
+
+class _QuietChoreographer:
+    """Stands in for the LLM-backed choreographer; conversation lifecycle lives on the agents"""
+    async def start_conversation(self, **kwargs):
+        return None
+
+
+def _engine_with_pair(location="Mess Hall"):
+    """Engine with two idle agents placed together at one location"""
+    engine = SimulationEngine()
+    engine.choreographer = _QuietChoreographer()
+    engine.is_running = True
+
+    first = GenerativeAgent("Cdr. Vikram Sharma", "Commander", Personality())
+    second = GenerativeAgent("Dr. Ananya Iyer", "Medical Officer", Personality())
+    engine.agents = [first, second]
+    engine._agent_by_id = {a.id: a for a in engine.agents}
+    engine._agent_by_name = {a.name: a for a in engine.agents}
+
+    now = datetime(2026, 1, 1, 9, 0)
+    for agent in engine.agents:
+        agent.cognitive_state.current_time = now
+        engine.move_agent(agent, location, from_loc="")
+    return engine, first, second
+
+
+def test_mutual_talk_keeps_one_conversation():
+    engine, first, second = _engine_with_pair()
+    decisions = [
+        {"action": "talk", "target": second.name, "thought": "Say hi", "dialogue": "Morning!"},
+        {"action": "talk", "target": first.name, "thought": "Say hi", "dialogue": "Hello!"},
+    ]
+
+    asyncio.run(engine._apply_decisions([first, second], decisions))
+
+    assert first.cognitive_state.chatting_with == second.name
+    assert second.cognitive_state.chatting_with == first.name
+    # The second agent's stale talk must not overwrite the conversation it was pulled into
+    assert second.cognitive_state.act_description == f"chatting with {first.name}"
+    assert second.cognitive_state.action_duration == 2
+    assert len(engine.activity_log) == 1
+
+
+def test_stale_move_is_dropped_for_pulled_in_partner():
+    engine, first, second = _engine_with_pair()
+    decisions = [
+        {"action": "talk", "target": second.name},
+        {"action": "move", "target": "Medical Bay"},
+    ]
+
+    asyncio.run(engine._apply_decisions([first, second], decisions))
+
+    assert second.cognitive_state.chatting_with == first.name
+    assert not second.cognitive_state.path_computed
+    assert second.cognitive_state.world_location == "Mess Hall"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
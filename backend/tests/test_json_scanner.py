@@ -0,0 +1,65 @@
+"""
+Tests for the streamed-decision JSON scanner used by the PARL engine.
+
+Run with pytest, or directly: python tests/test_json_scanner.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Importing the engine module builds the global PARLEngine; local mode needs no API key
+os.environ.setdefault("LLM_PROVIDER", "ollama")
+
+from app.parl.parl_engine import _JsonObjectScanner
+
+
+def _feed_all(chunks):
+    """Feed chunks until the scanner asks to stop; returns (stopped, scanner)"""
+    scanner = _JsonObjectScanner()
+    for chunk in chunks:
+        if scanner.feed(chunk):
+            return True, scanner
+    return False, scanner
+
+
+def test_stops_after_decision_object():
+    stopped, scanner = _feed_all(['{"action": "work", ', '"target": "research"}', " trailing prose"])
+    assert stopped
+    assert scanner.result == {"action": "work", "target": "research"}
+
+
+def test_nested_braces():
+    text = '{"action": "talk", "meta": {"inner": {"deep": 1}}, "target": "Vikram"}'
+    # Split one character at a time to exercise state across chunk boundaries
+    stopped, scanner = _feed_all(list(text))
+    assert stopped
+    assert scanner.result["meta"] == {"inner": {"deep": 1}}
+    assert scanner.result["target"] == "Vikram"
+
+
+def test_braces_inside_strings():
+    text = '{"action": "talk", "dialogue": "Use {curly} braces and a \\"}\\" quote"}'
+    stopped, scanner = _feed_all([text])
+    assert stopped
+    assert scanner.result["dialogue"] == 'Use {curly} braces and a "}" quote'
+
+
+def test_braces_in_leading_prose_are_skipped():
+    chunks = ["I think {maybe}. ", '{"action": "rest", ', '"target": "self"}']
+    stopped, scanner = _feed_all(chunks)
+    assert stopped
+    assert scanner.result == {"action": "rest", "target": "self"}
+
+
+def test_object_without_action_does_not_stop():
+    stopped, scanner = _feed_all(['{"note": "not a decision"}', " and nothing else"])
+    assert not stopped
+    assert scanner.result is None
+    assert scanner.text == '{"note": "not a decision"} and nothing else'
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -1,7 +1,9 @@
 
 import asyncio
+import json
 import os
 import sys
+from contextlib import asynccontextmanager
 from unittest.mock import MagicMock, AsyncMock
 from pathlib import Path
 
@@ -27,15 +29,52 @@ sys.modules["traceback"] = MagicMock() # Silence stack traces
 
 
 # Mock httpx with AsyncMock support
+# Response mimics a valid agent decision to TALK since they are together
+MOCK_DECISION = '{"action": "talk", "target": "Cdr. Vikram Sharma", "thought": "I see my colleague, I should say hi.", "dialogue": "Hello Vikram!"}'
+
 mock_httpx = MagicMock()
 mock_client = AsyncMock()
 mock_response = MagicMock()
 mock_response.status_code = 200
-# Response mimics a valid agent decision to TALK since they are together
-mock_response.json.return_value = {
-    "response": '{"action": "talk", "target": "Cdr. Vikram Sharma", "thought": "I see my colleague, I should say hi.", "dialogue": "Hello Vikram!"}'
-}
+# Non-streaming calls (reflections, conversations) still go through client.post
+mock_response.json.return_value = {"response": MOCK_DECISION}
 mock_client.post.return_value = mock_response
+
+
+class MockStreamResponse:
+    """Streaming response for client.stream(): decisions arrive in pieces, like a real model"""
+    status_code = 200
+    
+    def __init__(self, url: str):
+        self.url = url
+        self.pieces = [MOCK_DECISION[:25], MOCK_DECISION[25:70], MOCK_DECISION[70:], " Anything else?"]
+    
+    async def aiter_lines(self):
+        if "/api/generate" in self.url:
+            # Ollama: one NDJSON object per line
+            for piece in self.pieces:
+                yield json.dumps({"response": piece, "done": False})
+            yield json.dumps({"response": "", "done": True})
+        else:
+            # OpenAI-compatible providers (Groq/Cerebras): server-sent events
+            for piece in self.pieces:
+                yield "data: " + json.dumps({"choices": [{"delta": {"content": piece}}]})
+            yield "data: [DONE]"
+    
+    async def aiter_text(self):
+        async for line in self.aiter_lines():
+            yield line + "\n"
+    
+    async def aread(self) -> bytes:
+        return b""
+
+
+@asynccontextmanager
+async def mock_stream(method, url, **kwargs):
+    yield MockStreamResponse(url)
+
+
+mock_client.stream = MagicMock(side_effect=mock_stream)
 mock_client.__aenter__.return_value = mock_client
 mock_client.__aexit__.return_value = None
 mock_httpx.AsyncClient.return_value = mock_client
@@ -54,11 +93,23 @@ print("ℹ️ Forced HAS_FAISS = False for verification stability")
 async def verify():
     print("🚀 Starting Integration Verification (with mocked dependencies)...")
     
+    # VERIFY STREAMED LLM PATHS
+    # Both providers stream; the decision must be picked out of the chunked stream
+    from app.parl.parl_engine import parl_engine
+    expected = json.loads(MOCK_DECISION)
+    ollama_result = await parl_engine._call_ollama("verification prompt")
+    assert ollama_result == expected, f"Ollama stream parsed wrong: {ollama_result}"
+    sse_result = await parl_engine._stream_chat_completion(
+        "Groq", "https://mock/v1/chat/completions", "mock_key", "mock-model", "verification prompt"
+    )
+    assert sse_result == expected, f"SSE stream parsed wrong: {sse_result}"
+    print("✅ Streamed LLM decisions parsed (Ollama NDJSON + OpenAI-style SSE)")
+    
     # Initialize Engine
     engine = SimulationEngine()
     
     # Spy on the mocked LLM client to ensure social context is getting passed
-    # We want to check the call args of mock_client.post
+    # Decisions are streamed, so we check the call args of mock_client.stream
     
     # Start
     print("1. Initializing Simulation...")
@@ -83,11 +134,9 @@ async def verify():
     print(f"\n🧪 TEST SCENARIO: Moving {agent1.name} and {agent2.name} to {target_loc}...")
     
     # Force coordinates update
-    success1 = engine.environment.move_agent(agent1.id, agent1.name, agent1.cognitive_state.world_location, target_loc)
-    agent1.cognitive_state.world_location = target_loc
-    
-    success2 = engine.environment.move_agent(agent2.id, agent2.name, agent2.cognitive_state.world_location, target_loc)
-    agent2.cognitive_state.world_location = target_loc
+    # engine.move_agent is the single setter: it updates world_location and the environment tree
+    success1 = engine.move_agent(agent1, target_loc)
+    success2 = engine.move_agent(agent2, target_loc)
 
     if not (success1 and success2):
         print(f"⚠️ Warning: Move operation failed. Success: {success1}, {success2}")
@@ -125,7 +174,7 @@ async def verify():
                 print(f"      💬 Chatting with {agent.cognitive_state.chatting_with}")
         
     # Check if social context was passed to LLM
-    # We look at the last call to our mock_client.post
+    # We look at the last call to our mock_client.stream
     # The JSON body should have "agents_at_location" in the prompt or context (which is inside the prompt string for GenerativeAgent)
     # Actually, GenerativeAgent puts context into the Prompt string.
     
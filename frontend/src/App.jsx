@@ -99,6 +99,13 @@ function App() {
         }
         break;
 
+      case 'heartbeat':
+        // Answer so the server knows this client is still alive
+        if (wsRef.current && wsRef.current.readyState === WebSocket.OPEN) {
+          wsRef.current.send(JSON.stringify({ type: 'heartbeat' }));
+        }
+        break;
+
       default:
         console.log('Unknown message type:', data.type);
     }